@@ -7,8 +7,12 @@ from dotenv import load_dotenv
 backend_dir = Path(__file__).parent.parent
 env_path = backend_dir / ".env"
 
-if env_path.exists():
-    load_dotenv(dotenv_path=env_path, override=True)
-else:
-    # Try to load from any .env file in the current working directory
-    load_dotenv(override=True)
+# Worker and reload processes inherit the parent's environment, so the .env
+# file only needs to be parsed once per process tree.
+if os.environ.get("BACKEND_ENV_LOADED") != "1":
+    if env_path.exists():
+        load_dotenv(dotenv_path=env_path, override=True)
+    else:
+        # Try to load from any .env file in the current working directory
+        load_dotenv(override=True)
+    os.environ["BACKEND_ENV_LOADED"] = "1"
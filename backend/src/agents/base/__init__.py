@@ -1,4 +1,5 @@
-from .agent import BaseAgent
+import importlib
+
 from .exceptions import (
     BaseAgentError,
     ValidationError,
@@ -11,10 +12,37 @@ from .exceptions import (
     CompositionError,
     DownloadError,
 )
-from .llm_utils import call_llm_json
-from .storage import StorageBackend, LocalStorage, OSSStorage, create_storage
-from .task_storage import TaskStorageManager
-from .download_utils import download_to_bytes
+
+# Submodules pulling in langchain, pydantic and aiohttp are imported on first
+# attribute access (PEP 562) so importing the package stays cheap.
+_LAZY_IMPORTS = {
+    "BaseAgent": ".agent",
+    "call_llm_json": ".llm_utils",
+    "call_llm_json_batch": ".llm_utils",
+    "StorageBackend": ".storage",
+    "LocalStorage": ".storage",
+    "OSSStorage": ".storage",
+    "create_storage": ".storage",
+    "TaskStorageManager": ".task_storage",
+    "download_to_bytes": ".download_utils",
+    "close_session": ".download_utils",
+    "warm_up_connections": ".download_utils",
+    "HTTP2_AVAILABLE": ".http_utils",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
 
 __all__ = [
     "BaseAgent",
@@ -29,10 +57,14 @@ __all__ = [
     "CompositionError",
     "DownloadError",
     "call_llm_json",
+    "call_llm_json_batch",
     "StorageBackend",
     "LocalStorage",
     "OSSStorage",
     "create_storage",
     "TaskStorageManager",
     "download_to_bytes",
-]
\ No newline at end of file
+    "close_session",
+    "warm_up_connections",
+    "HTTP2_AVAILABLE",
+]
@@ -1,11 +1,32 @@
-from typing import TypeVar, Generic, Optional, Any
+from typing import TYPE_CHECKING, TypeVar, Generic, Optional, Any
 from abc import ABC, abstractmethod
 import logging
-from pydantic import BaseModel
 
 from .exceptions import ValidationError
 
-ConfigT = TypeVar('ConfigT', bound=BaseModel)
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+ConfigT = TypeVar('ConfigT', bound='BaseModel')
+
+
+def _check_not_empty(value, field_name: str):
+    if not value:
+        raise ValidationError(f"{field_name} cannot be empty")
+
+
+def _check_type(value, expected_type, field_name: str):
+    if not isinstance(value, expected_type):
+        raise ValidationError(
+            f"{field_name} must be {expected_type.__name__}, got {type(value).__name__}"
+        )
+
+
+def _check_list_not_empty(value, field_name: str):
+    if not isinstance(value, list):
+        raise ValidationError(f"{field_name} must be a list")
+    if not value:
+        raise ValidationError(f"{field_name} cannot be empty")
 
 
 class BaseAgent(ABC, Generic[ConfigT]):
@@ -58,18 +79,8 @@ class BaseAgent(ABC, Generic[ConfigT]):
             self.logger.error(f"{self.__class__.__name__} health check failed: {e}")
             return False
     
-    def _validate_not_empty(self, value, field_name: str):
-        if not value:
-            raise ValidationError(f"{field_name} cannot be empty")
-    
-    def _validate_type(self, value, expected_type, field_name: str):
-        if not isinstance(value, expected_type):
-            raise ValidationError(
-                f"{field_name} must be {expected_type.__name__}, got {type(value).__name__}"
-            )
-    
-    def _validate_list_not_empty(self, value, field_name: str):
-        if not isinstance(value, list):
-            raise ValidationError(f"{field_name} must be a list")
-        if not value:
-            raise ValidationError(f"{field_name} cannot be empty")
+    # Static aliases: no bound-method creation per call, and hot callers can
+    # use the module-level functions directly.
+    _validate_not_empty = staticmethod(_check_not_empty)
+    _validate_type = staticmethod(_check_type)
+    _validate_list_not_empty = staticmethod(_check_list_not_empty)
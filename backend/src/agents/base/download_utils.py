@@ -1,65 +1,386 @@
-import aiohttp
+import os
+import asyncio
+import shutil
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple, Type, Union
 import logging
 
+import aiohttp
+import httpx
+
 from .exceptions import DownloadError
+from .http_utils import HTTP2_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+# Remote files larger than this are fetched as parallel byte ranges when the
+# server honours Range requests.
+RANGE_THRESHOLD = 4 * 1024 * 1024
+RANGE_PARTS = 4
+
+# Idle pooled connections are kept this long so repeated downloads from the
+# same host skip DNS and TLS setup.
+KEEPALIVE_SECONDS = 75
+
+
+class _StreamResponse(NamedTuple):
+    status: int
+    headers: Mapping[str, str]
+    iter_chunks: Callable[[int], AsyncIterator[bytes]]
+
+
+class _HttpClient(ABC):
+    """Minimal streaming HTTP client used by the download helpers."""
+    
+    errors: Tuple[Type[BaseException], ...] = ()
+    
+    @abstractmethod
+    def stream(
+        self,
+        method: str,
+        url: str,
+        timeout: float,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """Async context manager yielding a _StreamResponse."""
+    
+    @property
+    @abstractmethod
+    def closed(self) -> bool:
+        pass
+    
+    @abstractmethod
+    async def close(self):
+        pass
+
+
+class _HttpxClient(_HttpClient):
+    
+    errors = (httpx.HTTPError,)
+    
+    def __init__(self):
+        self._client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=KEEPALIVE_SECONDS,
+            ),
+            follow_redirects=True,
+        )
+    
+    @asynccontextmanager
+    async def stream(self, method, url, timeout, headers=None):
+        async with self._client.stream(method, url, headers=headers, timeout=timeout) as response:
+            yield _StreamResponse(response.status_code, response.headers, response.aiter_bytes)
+    
+    @property
+    def closed(self) -> bool:
+        return self._client.is_closed
+    
+    async def close(self):
+        await self._client.aclose()
+
+
+class _AiohttpClient(_HttpClient):
+    
+    errors = (aiohttp.ClientError,)
+    
+    def __init__(self):
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=32,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            keepalive_timeout=KEEPALIVE_SECONDS,
+            enable_cleanup_closed=True,
+        )
+        self._session = aiohttp.ClientSession(connector=connector)
+    
+    @asynccontextmanager
+    async def stream(self, method, url, timeout, headers=None):
+        async with self._session.request(
+            method,
+            url,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            allow_redirects=True,
+        ) as response:
+            yield _StreamResponse(response.status, response.headers, response.content.iter_chunked)
+    
+    @property
+    def closed(self) -> bool:
+        return self._session.closed
+    
+    async def close(self):
+        await self._session.close()
+
+
+_CLIENT_CLASSES: Dict[str, Type[_HttpClient]] = {
+    "httpx": _HttpxClient,
+    "aiohttp": _AiohttpClient,
+}
+
+_client: Optional[_HttpClient] = None
+
+
+async def _get_client() -> _HttpClient:
+    """Return the shared download client, creating it on first use."""
+    global _client
+    if _client is None or _client.closed:
+        backend = os.getenv("DOWNLOAD_HTTP_CLIENT", "httpx").lower()
+        client_class = _CLIENT_CLASSES.get(backend)
+        if client_class is None:
+            raise DownloadError(f"Unknown DOWNLOAD_HTTP_CLIENT: {backend}")
+        _client = client_class()
+    return _client
+
+
+async def close_session():
+    """Close the shared download client. Call on application shutdown."""
+    global _client
+    if _client is not None and not _client.closed:
+        await _client.close()
+    _client = None
+
+
+async def warm_up_connections(urls: List[str], timeout: int = 10):
+    """
+    Open pooled connections to the given hosts ahead of the first download.
+    
+    Sends a HEAD request to each URL and ignores failures, so a missing or
+    slow host never blocks startup.
+    """
+    if not urls:
+        return
+    client = await _get_client()
+    
+    async def warm(url: str):
+        try:
+            async with client.stream("HEAD", url, timeout):
+                pass
+        except Exception as e:
+            logger.debug("Connection warm-up failed for %s: %s", url, e)
+    
+    await asyncio.gather(*(warm(url) for url in urls))
+    logger.info("Warmed up download connections for %d host(s)", len(urls))
+
+
+async def _local_file_size(path: str) -> Optional[int]:
+    """Return the size of a local file, or None if path is not a local file."""
+    try:
+        st = await asyncio.to_thread(os.stat, path)
+    except (OSError, ValueError):
+        return None
+    return st.st_size
+
+
+def _content_range_total(content_range: Optional[str]) -> Optional[int]:
+    """Total size from a "bytes start-end/total" header, or None if unknown."""
+    if not content_range or "/" not in content_range:
+        return None
+    total = content_range.rsplit("/", 1)[1]
+    return int(total) if total.isdigit() else None
+
+
+async def _stream_into(response: _StreamResponse, view: memoryview, start: int, end: int) -> bool:
+    """Copy a 206 body into view[start:end + 1]; False unless it fits exactly."""
+    offset = start
+    async for chunk in response.iter_chunks(65536):
+        if offset + len(chunk) > end + 1:
+            return False
+        view[offset:offset + len(chunk)] = chunk
+        offset += len(chunk)
+    return offset == end + 1
+
+
+async def _read_body(response: _StreamResponse, max_size: int) -> bytearray:
+    content_length = response.headers.get('Content-Length')
+    if content_length and int(content_length) > max_size:
+        raise DownloadError(
+            f"File too large: {content_length} bytes (max: {max_size})"
+        )
+    
+    data = bytearray()
+    async for chunk in response.iter_chunks(8192):
+        data.extend(chunk)
+        if len(data) > max_size:
+            raise DownloadError(
+                f"Downloaded data exceeded max size: {max_size} bytes"
+            )
+    return data
+
+
+async def _download_ranges(
+    client: _HttpClient,
+    url: str,
+    view: memoryview,
+    start: int,
+    validator: Optional[str],
+    timeout: int,
+) -> bool:
+    """Fill view[start:] with parallel byte-range requests; False if any part is not honoured."""
+    size = len(view)
+    part_size = -(-(size - start) // RANGE_PARTS)
+    
+    async def fetch_part(part_start: int) -> bool:
+        part_end = min(part_start + part_size, size) - 1
+        headers = {"Range": f"bytes={part_start}-{part_end}"}
+        if validator:
+            # A changed resource answers with 200 instead of 206, which
+            # makes the whole download fall back to a single stream
+            headers["If-Range"] = validator
+        try:
+            async with client.stream("GET", url, timeout, headers=headers) as response:
+                if response.status != 206:
+                    return False
+                return await _stream_into(response, view, part_start, part_end)
+        except (*client.errors, asyncio.TimeoutError) as e:
+            logger.debug("Range %d-%d of %s failed: %s", part_start, part_end, url, e)
+            return False
+    
+    tasks = [asyncio.ensure_future(fetch_part(part_start)) for part_start in range(start, size, part_size)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            if not await next_done:
+                return False
+        return True
+    finally:
+        # Once one part has failed the others are wasted work
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
 
-async def download_to_bytes(url: str, timeout: int = 60, max_size: int = 50 * 1024 * 1024) -> bytes:
-    if Path(url).exists():
-        file_path = Path(url)
-        file_size = file_path.stat().st_size
+async def _download_with_ranges(
+    client: _HttpClient,
+    url: str,
+    timeout: int,
+    max_size: int,
+) -> Optional[bytearray]:
+    """
+    Download url starting with a GET for only its first RANGE_THRESHOLD bytes.
+    
+    Small files and servers that ignore Range are answered in full by that
+    one request. A larger file reports its size in Content-Range and the rest
+    is fetched as parallel ranges, so no HEAD preflight is needed. Returns
+    None when the caller should fall back to a plain GET.
+    """
+    headers = {"Range": f"bytes=0-{RANGE_THRESHOLD - 1}"}
+    async with client.stream("GET", url, timeout, headers=headers) as response:
+        if response.status == 200:
+            return await _read_body(response, max_size)
+        if response.status == 416:
+            # Empty resources cannot satisfy any range
+            return None
+        if response.status != 206:
+            raise DownloadError(f"Download failed: HTTP {response.status}")
+        
+        size = _content_range_total(response.headers.get('Content-Range'))
+        if size is None:
+            return None
+        if size > max_size:
+            raise DownloadError(f"File too large: {size} bytes (max: {max_size})")
+        validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+        
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        head_size = min(RANGE_THRESHOLD, size)
+        if not await _stream_into(response, view, 0, head_size - 1):
+            return None
+    
+    if head_size < size:
+        if not await _download_ranges(client, url, view, head_size, validator, timeout):
+            logger.debug("Range download not honoured by %s, falling back to single stream", url)
+            return None
+        logger.debug("Downloaded %d bytes from %s in ranged parts", size, url)
+    # Returned as is: converting to bytes would copy the whole payload
+    return buffer
+
+
+async def download_to_bytes(
+    url: str,
+    timeout: int = 60,
+    max_size: int = 50 * 1024 * 1024,
+) -> Union[bytes, bytearray]:
+    file_size = await _local_file_size(url)
+    if file_size is not None:
         if file_size > max_size:
             raise DownloadError(f"File too large: {file_size} bytes (max: {max_size})")
-        return file_path.read_bytes()
+        return await asyncio.to_thread(Path(url).read_bytes)
     
-    timeout_obj = aiohttp.ClientTimeout(total=timeout)
     try:
-        async with aiohttp.ClientSession(timeout=timeout_obj) as session:
-            async with session.get(url) as response:
+        client = await _get_client()
+        
+        data = await _download_with_ranges(client, url, timeout, max_size)
+        if data is None:
+            async with client.stream("GET", url, timeout) as response:
                 if response.status != 200:
                     raise DownloadError(f"Download failed: HTTP {response.status}")
-                
-                content_length = response.headers.get('Content-Length')
-                if content_length and int(content_length) > max_size:
-                    raise DownloadError(
-                        f"File too large: {content_length} bytes (max: {max_size})"
-                    )
-                
-                data = bytearray()
-                async for chunk in response.content.iter_chunked(8192):
-                    data.extend(chunk)
-                    if len(data) > max_size:
-                        raise DownloadError(
-                            f"Downloaded data exceeded max size: {max_size} bytes"
-                        )
-                
-                logger.debug(f"Downloaded {len(data)} bytes from {url}")
-                return bytes(data)
-    
-    except aiohttp.ClientError as e:
-        logger.error(f"Failed to download from {url}: {e}")
+                data = await _read_body(response, max_size)
+        
+        logger.debug("Downloaded %d bytes from %s", len(data), url)
+        return data
+    
+    except (aiohttp.ClientError, httpx.HTTPError) as e:
+        logger.error("Failed to download from %s: %s", url, e)
         raise DownloadError(f"Failed to download file: {e}") from e
     
     except Exception as e:
-        logger.error(f"Unexpected error downloading from {url}: {e}")
+        logger.error("Unexpected error downloading from %s: %s", url, e)
         raise DownloadError(f"Failed to download file: {e}") from e
 
 
+async def _download_stream(url: str, destination: Path, timeout: int, max_size: int) -> int:
+    client = await _get_client()
+    async with client.stream("GET", url, timeout) as response:
+        if response.status != 200:
+            raise DownloadError(f"Download failed: HTTP {response.status}")
+        
+        content_length = response.headers.get('Content-Length')
+        if content_length and int(content_length) > max_size:
+            raise DownloadError(
+                f"File too large: {content_length} bytes (max: {max_size})"
+            )
+        
+        total = 0
+        f = await asyncio.to_thread(open, destination, 'wb')
+        try:
+            async for chunk in response.iter_chunks(65536):
+                total += len(chunk)
+                if total > max_size:
+                    raise DownloadError(
+                        f"Downloaded data exceeded max size: {max_size} bytes"
+                    )
+                await asyncio.to_thread(f.write, chunk)
+        except BaseException:
+            await asyncio.to_thread(f.close)
+            destination.unlink(missing_ok=True)
+            raise
+        await asyncio.to_thread(f.close)
+        
+        return total
+
+
 async def download_file(url: str, destination: str, timeout: int = 60, max_size: int = 50 * 1024 * 1024) -> str:
+    dest_path = Path(destination)
     try:
-        data = await download_to_bytes(url, timeout, max_size)
+        await asyncio.to_thread(dest_path.parent.mkdir, parents=True, exist_ok=True)
         
-        dest_path = Path(destination)
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        dest_path.write_bytes(data)
+        file_size = await _local_file_size(url)
+        if file_size is not None:
+            if file_size > max_size:
+                raise DownloadError(f"File too large: {file_size} bytes (max: {max_size})")
+            await asyncio.to_thread(shutil.copyfile, url, dest_path)
+        else:
+            total = await _download_stream(url, dest_path, timeout, max_size)
+            logger.debug("Downloaded %d bytes from %s", total, url)
         
-        logger.info(f"Downloaded file saved to: {destination}")
+        logger.info("Downloaded file saved to: %s", destination)
         return destination
     
     except Exception as e:
-        logger.error(f"Failed to download and save file: {e}")
+        logger.error("Failed to download and save file: %s", e)
         raise DownloadError(f"Failed to download and save file: {e}") from e
@@ -0,0 +1,8 @@
+# httpx only speaks HTTP/2 when the optional h2 package is installed
+# (httpx[http2]); clients opt in only when it is, so they never fail at
+# construction time.
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
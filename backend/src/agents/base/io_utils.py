@@ -0,0 +1,25 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Dedicated pool so bursts of image/audio saves and uploads don't queue
+# behind other work on the loop's default executor
+storage_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("STORAGE_THREAD_POOL_SIZE", "64")),
+    thread_name_prefix="task-storage",
+)
+
+
+def write_bytes(path_str: str, data: bytes) -> None:
+    # Raw fd write skips the FileIO + BufferedWriter that Path.write_bytes builds;
+    # O_BINARY keeps Windows from translating newlines in the payload
+    fd = os.open(
+        path_str,
+        os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+        0o644,
+    )
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
@@ -0,0 +1,31 @@
+from enum import Enum
+from typing import Dict
+
+
+class LLMCapability(Enum):
+    JSON_MODE = "json_mode"
+    IMAGE_GENERATION = "image_generation"
+    AUDIO_GENERATION = "audio_generation"
+    TEXT_GENERATION = "text_generation"
+
+
+class LLMType(Enum):
+    GPT4O = "gpt-4o"
+    GPT4O_MINI = "gpt-4o-mini"
+    GPT35_TURBO = "gpt-3.5-turbo"
+
+
+LLM_CAPABILITIES: Dict[LLMType, list[LLMCapability]] = {
+    LLMType.GPT4O: [
+        LLMCapability.JSON_MODE,
+        LLMCapability.TEXT_GENERATION,
+    ],
+    LLMType.GPT4O_MINI: [
+        LLMCapability.JSON_MODE,
+        LLMCapability.TEXT_GENERATION,
+    ],
+    LLMType.GPT35_TURBO: [
+        LLMCapability.JSON_MODE,
+        LLMCapability.TEXT_GENERATION,
+    ],
+}
@@ -1,22 +1,108 @@
-from typing import Dict, Any, Optional, Type, Union
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Type, Union, Tuple
+from collections import OrderedDict
+from functools import lru_cache
 import logging
 
+import orjson
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
-from langchain_core.language_models import BaseChatModel
-from pydantic import BaseModel
+from langchain_core.outputs import ChatGeneration
 
 from .exceptions import ParseError, APIError
+from .llm_capabilities import LLMCapability, LLM_CAPABILITIES
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+    from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+_json_parser = JsonOutputParser()
+
+# Matched as prefixes so dated snapshots (gpt-4o-2024-08-06) qualify too
+_JSON_MODE_MODEL_PREFIXES = tuple(
+    llm_type.value
+    for llm_type, capabilities in LLM_CAPABILITIES.items()
+    if LLMCapability.JSON_MODE in capabilities
+)
+
+_STRUCTURED_LLM_CACHE_SIZE = 32
+_structured_llm_cache: "OrderedDict[Tuple[int, type], Any]" = OrderedDict()
+
+
+@lru_cache(maxsize=128)
+def _build_prompt(system_role: str, prompt_template: str) -> ChatPromptTemplate:
+    return ChatPromptTemplate.from_messages([
+        ("system", system_role),
+        ("human", prompt_template)
+    ])
+
+
+def _get_structured_llm(llm: "BaseChatModel", pydantic_model: Type["BaseModel"]):
+    # Chat models are unhashable, so key on id(). A cached runnable holds its
+    # llm alive, which keeps the id valid but means the cache must stay bounded.
+    key = (id(llm), pydantic_model)
+    structured_llm = _structured_llm_cache.get(key)
+    if structured_llm is not None:
+        _structured_llm_cache.move_to_end(key)
+        return structured_llm
+    
+    structured_llm = llm.with_structured_output(pydantic_model)
+    _structured_llm_cache[key] = structured_llm
+    if len(_structured_llm_cache) > _STRUCTURED_LLM_CACHE_SIZE:
+        _structured_llm_cache.popitem(last=False)
+    return structured_llm
+
+
+def _to_dict(result: Any) -> Dict[str, Any]:
+    # Convert Pydantic model to dict
+    if hasattr(result, 'model_dump'):
+        return result.model_dump()  # type: ignore
+    elif hasattr(result, 'dict'):
+        return result.dict()  # type: ignore
+    else:
+        # If it's already a dict, return as is
+        return dict(result) if not isinstance(result, dict) else result
+
+
+def _supports_json_mode(llm: "BaseChatModel") -> bool:
+    model_name = getattr(llm, "model_name", None) or getattr(llm, "model", None)
+    return isinstance(model_name, str) and model_name.startswith(_JSON_MODE_MODEL_PREFIXES)
+
+
+def _parse_json_message(message: Any) -> Dict[str, Any]:
+    # Decode plain JSON replies in one pass; fall back to
+    # JsonOutputParser for replies wrapped in markdown fences or prose
+    try:
+        return orjson.loads(message.content)
+    except (orjson.JSONDecodeError, TypeError):
+        return _json_parser.parse_result([ChatGeneration(message=message)])
+
+
+def _convert_error(
+    e: Exception,
+    parse_error_class: Optional[Type[Exception]],
+    api_error_class: Optional[Type[Exception]],
+) -> Exception:
+    # Determine error type
+    if "parse" in str(e).lower() or "json" in str(e).lower():
+        error_class = parse_error_class or ParseError
+        return error_class(f"Failed to parse JSON response: {e}")
+    elif api_error_class is not None:
+        return api_error_class(f"LLM API call failed: {e}")
+    elif isinstance(e, APIError):
+        # Already an APIError
+        return e
+    else:
+        return APIError(f"LLM API call failed: {e}")
+
 
 async def call_llm_json(
-    llm: BaseChatModel,
+    llm: "BaseChatModel",
     prompt_template: Union[str, ChatPromptTemplate],
     variables: Optional[Dict[str, Any]] = None,
     system_role: str = "You are a professional assistant.",
-    pydantic_model: Optional[Type[BaseModel]] = None,
+    pydantic_model: Optional[Type["BaseModel"]] = None,
     parse_error_class: Optional[Type[Exception]] = None,
     api_error_class: Optional[Type[Exception]] = None,
 ) -> Dict[str, Any]:
@@ -39,51 +125,104 @@ async def call_llm_json(
         ParseError: If JSON parsing fails
         APIError: If LLM API call fails
     """
+    results = await call_llm_json_batch(
+        llm=llm,
+        prompt_template=prompt_template,
+        variables_list=[variables or {}],
+        system_role=system_role,
+        pydantic_model=pydantic_model,
+        parse_error_class=parse_error_class,
+        api_error_class=api_error_class,
+    )
+    return results[0]
+
+
+async def call_llm_json_batch(
+    llm: "BaseChatModel",
+    prompt_template: Union[str, ChatPromptTemplate],
+    variables_list: List[Dict[str, Any]],
+    system_role: str = "You are a professional assistant.",
+    pydantic_model: Optional[Type["BaseModel"]] = None,
+    parse_error_class: Optional[Type[Exception]] = None,
+    api_error_class: Optional[Type[Exception]] = None,
+    max_concurrency: int = 8,
+    return_exceptions: bool = False,
+) -> List[Union[Dict[str, Any], Exception]]:
+    """
+    Call LLM with structured JSON output for several variable sets concurrently.
+    
+    The chain is built once and run with LangChain's abatch, so up to
+    max_concurrency requests are in flight at the same time.
+    
+    Args:
+        llm: Language model to use for the calls
+        prompt_template: LangChain ChatPromptTemplate or template string
+        variables_list: One variables dict per call
+        system_role: System role message
+        pydantic_model: Optional Pydantic model for structured output
+        parse_error_class: Custom exception class for parse errors
+        api_error_class: Custom exception class for API errors
+        max_concurrency: Maximum number of concurrent LLM calls
+        return_exceptions: Return a failed call's error in its slot instead
+            of raising, so the other calls' results are kept
+    
+    Returns:
+        List[Union[Dict[str, Any], Exception]]: Parsed JSON responses, in
+        input order; errors appear only when return_exceptions is True
+    
+    Raises:
+        ParseError: If JSON parsing fails for any call
+        APIError: If any LLM API call fails
+    """
+    if not variables_list:
+        return []
+    
     try:
         # Create prompt template if string provided
         if isinstance(prompt_template, str):
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", system_role),
-                ("human", prompt_template)
-            ])
+            prompt = _build_prompt(system_role, prompt_template)
         else:
             prompt = prompt_template
         
+        config = {"max_concurrency": max_concurrency}
+        
         # Use with_structured_output if Pydantic model provided
         if pydantic_model:
-            structured_llm = llm.with_structured_output(pydantic_model)
+            structured_llm = _get_structured_llm(llm, pydantic_model)
             chain = prompt | structured_llm
-            result = await chain.ainvoke(variables or {})
-            # Convert Pydantic model to dict
-            if hasattr(result, 'model_dump'):
-                result_dict = result.model_dump()  # type: ignore
-            elif hasattr(result, 'dict'):
-                result_dict = result.dict()  # type: ignore
-            else:
-                # If it's already a dict, return as is
-                result_dict = dict(result) if not isinstance(result, dict) else result
-            return result_dict
+            convert = _to_dict
         else:
-            # Use JsonOutputParser for generic JSON
-            parser = JsonOutputParser()
-            chain = prompt | llm | parser
-            
-            # Invoke chain
-            result = await chain.ainvoke(variables or {})
-            return result
+            # Ask for native JSON mode where the provider supports it so the
+            # reply is bare JSON and decodes in a single orjson pass
+            if _supports_json_mode(llm):
+                chain = prompt | llm.bind(response_format={"type": "json_object"})
+            else:
+                chain = prompt | llm
+            convert = _parse_json_message
+        
+        outputs = await chain.abatch(
+            variables_list, config=config, return_exceptions=return_exceptions
+        )
+        if not return_exceptions:
+            return [convert(output) for output in outputs]
+        
+        results: List[Union[Dict[str, Any], Exception]] = []
+        for output in outputs:
+            try:
+                if isinstance(output, Exception):
+                    raise output
+                results.append(convert(output))
+            except Exception as e:
+                logger.error("LLM JSON call failed: %s", e)
+                error = _convert_error(e, parse_error_class, api_error_class)
+                if error is not e:
+                    error.__cause__ = e
+                results.append(error)
+        return results
     
     except Exception as e:
-        logger.error(f"LLM JSON call failed: {e}")
-        
-        # Determine error type
-        if "parse" in str(e).lower() or "json" in str(e).lower():
-            error_class = parse_error_class or ParseError
-            raise error_class(f"Failed to parse JSON response: {e}") from e
-        elif api_error_class is not None:
-            raise api_error_class(f"LLM API call failed: {e}") from e
-        else:
-            # Check if the exception is already an APIError
-            if isinstance(e, APIError):
-                raise
-            else:
-                raise APIError(f"LLM API call failed: {e}") from e
\ No newline at end of file
+        logger.error("LLM JSON call failed: %s", e)
+        error = _convert_error(e, parse_error_class, api_error_class)
+        if error is e:
+            raise
+        raise error from e
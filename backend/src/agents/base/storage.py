@@ -1,11 +1,15 @@
 import os
 import asyncio
+import shutil
+import tempfile
+from functools import partial
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Optional
 import logging
 
 from .exceptions import StorageError
+from .io_utils import storage_executor, write_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +31,18 @@ class StorageBackend(ABC):
         """Cleanup resources. Override in subclasses if needed."""
         pass
     
+    async def _run_blocking(self, func, *args, **kwargs):
+        # Same dedicated pool as TaskStorageManager, so large writes and uploads
+        # don't hold slots on the loop's default executor
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(storage_executor, partial(func, *args, **kwargs))
+    
     async def save_file(self, file_path: str, filename: str) -> str:
         try:
             data = Path(file_path).read_bytes()
             return await self.save(data, filename)
         except Exception as e:
-            logger.error(f"Failed to save file {file_path}: {e}")
+            logger.error("Failed to save file %s: %s", file_path, e)
             raise StorageError(f"Failed to save file: {e}") from e
 
 
@@ -47,17 +57,13 @@ class LocalStorage(StorageBackend):
             file_path = self.base_path / filename
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: file_path.write_bytes(data)
-            )
+            await self._run_blocking(write_bytes, str(file_path), data)
             
-            logger.info(f"File saved to local storage: {file_path}")
+            logger.info("File saved to local storage: %s", file_path)
             return str(file_path)
         
         except Exception as e:
-            logger.error(f"Failed to save to local storage: {e}")
+            logger.error("Failed to save to local storage: %s", e)
             raise StorageError(f"Failed to save file: {e}") from e
     
     async def save_file(self, file_path: str, filename: str) -> str:
@@ -65,28 +71,30 @@ class LocalStorage(StorageBackend):
             dest_path = self.base_path / filename
             dest_path.parent.mkdir(parents=True, exist_ok=True)
             
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: dest_path.write_bytes(Path(file_path).read_bytes())
-            )
+            await self._run_blocking(shutil.copyfile, file_path, dest_path)
             
-            logger.info(f"File saved to local storage: {dest_path}")
+            logger.info("File saved to local storage: %s", dest_path)
             return str(dest_path)
         
         except Exception as e:
-            logger.error(f"Failed to save file to local storage: {e}")
+            logger.error("Failed to save file to local storage: %s", e)
             raise StorageError(f"Failed to save file: {e}") from e
 
 
 class OSSStorage(StorageBackend):
     
+    # Files at or above this size are uploaded as parallel multipart PUTs
+    MULTIPART_THRESHOLD = 100 * 1024 * 1024
+    MULTIPART_PART_SIZE = 8 * 1024 * 1024
+    MULTIPART_THREADS = 4
+    
     def __init__(
         self,
         bucket: str,
         endpoint: str,
         access_key: str,
         secret_key: str,
+        checkpoint_dir: Optional[str] = None,
     ):
         self.bucket = bucket
         self.endpoint = endpoint
@@ -94,6 +102,11 @@ class OSSStorage(StorageBackend):
         self.secret_key = secret_key
         self._bucket_instance = None
         self._auth = None
+        # Resume checkpoints for multipart uploads; oss2 would otherwise put
+        # them under the service user's home directory
+        self.checkpoint_dir = checkpoint_dir or os.path.join(
+            tempfile.gettempdir(), "oss-upload-checkpoints"
+        )
     
     def _get_bucket(self):
         """Get or create OSS bucket instance (reusable connection)"""
@@ -116,44 +129,49 @@ class OSSStorage(StorageBackend):
     async def save(self, data: bytes, filename: str) -> str:
         try:
             bucket = self._get_bucket()
-            
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: bucket.put_object(filename, data)
-            )
+            await self._run_blocking(bucket.put_object, filename, data)
             
             url = f"https://{self.bucket}.{self.endpoint}/{filename}"
-            logger.info(f"File uploaded to OSS: {url}")
+            logger.info("File uploaded to OSS: %s", url)
             return url
         
         except ImportError as e:
             raise e
         
         except Exception as e:
-            logger.error(f"Failed to upload to OSS: {e}")
+            logger.error("Failed to upload to OSS: %s", e)
             raise StorageError(f"Failed to upload file: {e}") from e
     
     async def save_file(self, file_path: str, filename: str) -> str:
         try:
             bucket = self._get_bucket()
+            file_size = os.path.getsize(file_path)
             
-            loop = asyncio.get_event_loop()
-            with open(file_path, 'rb') as f:
-                result = await loop.run_in_executor(
-                    None,
-                    lambda: bucket.put_object(filename, f)
+            if file_size >= self.MULTIPART_THRESHOLD:
+                import oss2
+                await self._run_blocking(
+                    oss2.resumable_upload,
+                    bucket,
+                    filename,
+                    file_path,
+                    store=oss2.ResumableStore(root=self.checkpoint_dir),
+                    multipart_threshold=self.MULTIPART_THRESHOLD,
+                    part_size=self.MULTIPART_PART_SIZE,
+                    num_threads=self.MULTIPART_THREADS,
                 )
+            else:
+                with open(file_path, 'rb') as f:
+                    await self._run_blocking(bucket.put_object, filename, f)
             
             url = f"https://{self.bucket}.{self.endpoint}/{filename}"
-            logger.info(f"File uploaded to OSS: {url}")
+            logger.info("File uploaded to OSS: %s", url)
             return url
         
         except ImportError as e:
             raise StorageError("oss2 package is required for OSS storage. Install it with: pip install oss2") from e
         
         except Exception as e:
-            logger.error(f"Failed to upload file to OSS: {e}")
+            logger.error("Failed to upload file to OSS: %s", e)
             raise StorageError(f"Failed to upload file: {e}") from e
 
 
@@ -166,6 +184,7 @@ def create_storage(storage_type: str, **kwargs) -> StorageBackend:
             endpoint=kwargs.get("endpoint", ""),
             access_key=kwargs.get("access_key", ""),
             secret_key=kwargs.get("secret_key", ""),
+            checkpoint_dir=kwargs.get("checkpoint_dir"),
         )
     else:
         raise ValueError(f"Unknown storage type: {storage_type}")
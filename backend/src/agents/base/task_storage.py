@@ -1,18 +1,44 @@
 import os
 import asyncio
+import itertools
+import shutil
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Set, Tuple
 import logging
 
 from .exceptions import StorageError
+from .io_utils import storage_executor, write_bytes
 
 logger = logging.getLogger(__name__)
 
+# Files handed to a worker thread per dispatch when a burst of writes drains
+_WRITES_PER_JOB = 4
+
+
+def _write_batch(batch: List[Tuple[str, bytes]]) -> List[Optional[Exception]]:
+    errors: List[Optional[Exception]] = []
+    for path_str, data in batch:
+        try:
+            write_bytes(path_str, data)
+            errors.append(None)
+        except Exception as e:
+            errors.append(e)
+    return errors
+
 
 class TaskStorageManager:
     
-    def __init__(self, task_id: str, base_path: str = "./data/tasks"):
+    def __init__(
+        self,
+        task_id: str,
+        base_path: str = "./data/tasks",
+        executor: Optional[ThreadPoolExecutor] = None,
+        filename_stamp_length: int = 8,
+    ):
         self.task_id = task_id
+        self._executor = executor or storage_executor
         self.base_path = Path(base_path).resolve() / task_id
         self.base_path.mkdir(parents=True, exist_ok=True)
         
@@ -20,22 +46,36 @@ class TaskStorageManager:
         self.audio_dir = self.base_path / "audio"
         self.temp_dir = self.base_path / "temp"
         
-        self.images_dir.mkdir(exist_ok=True)
-        self.audio_dir.mkdir(exist_ok=True)
-        self.temp_dir.mkdir(exist_ok=True)
+        # Subdirectories are created on first use; most agents only ever
+        # touch one of them
+        self._created_dirs: Set[str] = set()
+        
+        # String prefixes let per-file paths be built by concatenation
+        # instead of a Path join + str() on every save and lookup
+        self._images_prefix = str(self.images_dir) + os.sep
+        self._audio_prefix = str(self.audio_dir) + os.sep
+        self._temp_prefix = str(self.temp_dir) + os.sep
+        
+        self._pending: List[Tuple[str, bytes, asyncio.Future]] = []
+        self._drainer: Optional[asyncio.Task] = None
+        
+        # Generated names are a per-manager random stamp plus a counter, so
+        # only one uuid4 is drawn however many files are written
+        self._file_stamp = uuid.uuid4().hex[:filename_stamp_length]
+        self._file_counter = itertools.count()
+    
+    def next_filename(self, stem: str, extension: str) -> str:
+        """生成在本管理器内唯一的文件名"""
+        return f"{stem}_{self._file_stamp}_{next(self._file_counter)}.{extension}"
     
     async def save_image(self, image_data: bytes, filename: str) -> str:
         try:
-            file_path = self.images_dir / filename
-            
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: file_path.write_bytes(image_data)
-            )
+            self._ensure_dir(self.images_dir, self._images_prefix)
+            file_path = self._images_prefix + filename
+            await self._write_file(file_path, image_data)
             
             logger.info(f"Image saved to task storage: {file_path}")
-            return str(file_path)
+            return file_path
         
         except Exception as e:
             logger.error(f"Failed to save image: {e}")
@@ -43,16 +83,12 @@ class TaskStorageManager:
     
     async def save_audio(self, audio_data: bytes, filename: str) -> str:
         try:
-            file_path = self.audio_dir / filename
-            
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: file_path.write_bytes(audio_data)
-            )
+            self._ensure_dir(self.audio_dir, self._audio_prefix)
+            file_path = self._audio_prefix + filename
+            await self._write_file(file_path, audio_data)
             
             logger.info(f"Audio saved to task storage: {file_path}")
-            return str(file_path)
+            return file_path
         
         except Exception as e:
             logger.error(f"Failed to save audio: {e}")
@@ -60,51 +96,93 @@ class TaskStorageManager:
     
     async def save_temp(self, data: bytes, filename: str) -> str:
         try:
-            file_path = self.temp_dir / filename
-            
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: file_path.write_bytes(data)
-            )
+            self.ensure_temp_dir()
+            file_path = self._temp_prefix + filename
+            await self._write_file(file_path, data)
             
             logger.debug(f"Temp file saved: {file_path}")
-            return str(file_path)
+            return file_path
         
         except Exception as e:
             logger.error(f"Failed to save temp file: {e}")
             raise StorageError(f"Failed to save temp file: {e}") from e
     
+    def _ensure_dir(self, directory: Path, prefix: str) -> None:
+        if prefix not in self._created_dirs:
+            directory.mkdir(exist_ok=True)
+            self._created_dirs.add(prefix)
+    
+    def ensure_temp_dir(self) -> Path:
+        """确保临时目录存在，供直接在 temp_dir 下写文件的调用方使用"""
+        self._ensure_dir(self.temp_dir, self._temp_prefix)
+        return self.temp_dir
+    
+    async def _write_file(self, file_path: str, data: bytes) -> None:
+        # Writes issued in the same event loop tick are coalesced and handed
+        # to a worker thread in one dispatch instead of one job per file.
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((file_path, data, future))
+        if self._drainer is None or self._drainer.done():
+            self._drainer = asyncio.create_task(self._drain_writes())
+        await future
+    
+    async def _drain_writes(self) -> None:
+        while self._pending:
+            # Let other coroutines enqueue their writes before snapshotting
+            await asyncio.sleep(0)
+            batch, self._pending = self._pending, []
+            # A few files share each dispatch; a larger burst still fans out
+            # across the pool instead of being written serially on one thread
+            await asyncio.gather(*(
+                self._write_slice(batch[start:start + _WRITES_PER_JOB])
+                for start in range(0, len(batch), _WRITES_PER_JOB)
+            ))
+    
+    async def _write_slice(self, batch: List[Tuple[str, bytes, asyncio.Future]]) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            errors = await loop.run_in_executor(
+                self._executor, _write_batch, [(path, data) for path, data, _ in batch]
+            )
+        except BaseException as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            raise
+        for (_, _, future), error in zip(batch, errors):
+            if future.done():
+                continue
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+    
     def get_image_path(self, filename: str) -> str:
-        return str(self.images_dir / filename)
+        return self._images_prefix + filename
     
     def get_audio_path(self, filename: str) -> str:
-        return str(self.audio_dir / filename)
+        return self._audio_prefix + filename
     
     def get_temp_path(self, filename: str) -> str:
-        return str(self.temp_dir / filename)
+        return self._temp_prefix + filename
     
     async def cleanup_temp(self):
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             await loop.run_in_executor(
-                None,
+                self._executor,
                 self._cleanup_directory,
                 self.temp_dir
             )
+            self._created_dirs.add(self._temp_prefix)
             logger.info(f"Cleaned up temp directory for task {self.task_id}")
         
         except Exception as e:
             logger.warning(f"Failed to cleanup temp directory: {e}")
     
     def _cleanup_directory(self, directory: Path):
-        if directory.exists():
-            for file_path in directory.iterdir():
-                try:
-                    if file_path.is_file():
-                        file_path.unlink()
-                    elif file_path.is_dir():
-                        import shutil
-                        shutil.rmtree(file_path)
-                except Exception as e:
-                    logger.warning(f"Failed to delete {file_path}: {e}")
+        # One native tree walk instead of a Python-level unlink per entry.
+        # The directory is recreated right away, because callers such as
+        # SceneComposer keep temp_dir and write into it directly.
+        shutil.rmtree(directory, ignore_errors=True)
+        directory.mkdir(exist_ok=True)
@@ -1,7 +1,9 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import logging
-import copy
-from collections import defaultdict
+import weakref
+from collections import OrderedDict, defaultdict
+
+import orjson
 
 from langchain_openai import ChatOpenAI
 from pydantic import ValidationError as PydanticValidationError
@@ -18,10 +20,32 @@ from .models import (
 )
 from ..base.exceptions import ValidationError, ParseError, APIError
 from .prompts import NOVEL_PARSE_PROMPT_TEMPLATE
-from ..base.llm_utils import call_llm_json
+from ..base.llm_utils import call_llm_json, call_llm_json_batch
 
 logger = logging.getLogger(__name__)
 
+# Parsed chunk results keyed by (llm instance, chunk text, limits). LLMFactory
+# hands out shared instances, so identical chunks hit across tasks. Payloads are
+# stored serialized so every hit decodes a fresh copy _merge_results may mutate;
+# the weakref guards against a recycled id() of a collected llm.
+_CHUNK_CACHE_SIZE = 256
+_chunk_cache: "OrderedDict[tuple, Tuple[weakref.ref, bytes]]" = OrderedDict()
+
+
+def _chunk_cache_get(llm: Any, key: tuple) -> Optional[bytes]:
+    entry = _chunk_cache.get(key)
+    if entry is None or entry[0]() is not llm:
+        return None
+    _chunk_cache.move_to_end(key)
+    return entry[1]
+
+
+def _chunk_cache_put(llm: Any, key: tuple, payload: bytes):
+    _chunk_cache[key] = (weakref.ref(llm), payload)
+    _chunk_cache.move_to_end(key)
+    if len(_chunk_cache) > _CHUNK_CACHE_SIZE:
+        _chunk_cache.popitem(last=False)
+
 
 class NovelParserAgent:
     """
@@ -112,23 +136,55 @@ class NovelParserAgent:
         options: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         chunks = self._split_text_into_chunks(novel_text)
-        chunk_results = []
+        variables_list = [self._build_variables(chunk, options) for chunk in chunks]
         
-        for i, chunk in enumerate(chunks):
-            variables = self._build_variables(chunk, options)
-            
+        use_cache = self.config.enable_cache
+        keys = [
+            (id(self.llm), v["novel_text"], v["max_characters"], v["max_scenes"])
+            for v in variables_list
+        ]
+        cached = [_chunk_cache_get(self.llm, key) if use_cache else None for key in keys]
+        misses = [i for i, payload in enumerate(cached) if payload is None]
+        # Hits decode a private copy of the cached payload; fresh results are
+        # used as returned and only serialized when they go into the cache
+        chunk_results: List[Optional[Dict[str, Any]]] = [
+            None if payload is None else orjson.loads(payload) for payload in cached
+        ]
+        
+        # Chunks are independent, so issue the LLM calls as one concurrent batch.
+        # Failures come back in place, so chunks that did parse are still
+        # cached and a retry only re-sends the failed ones.
+        if misses:
             try:
-                parsed_chunk = await call_llm_json(
+                results = await call_llm_json_batch(
                     llm=self.llm,
                     prompt_template=NOVEL_PARSE_PROMPT_TEMPLATE,
-                    variables=variables,
+                    variables_list=[variables_list[i] for i in misses],
                     parse_error_class=ParseError,
-                    api_error_class=APIError
+                    api_error_class=APIError,
+                    max_concurrency=self.config.max_concurrency,
+                    return_exceptions=True,
                 )
-                chunk_results.append(parsed_chunk)
             except Exception as e:
-                logger.error(f"Failed to parse chunk {i}: {e}")
-                raise ParseError(f"Failed to parse chunk {i}: {e}") from e
+                logger.error(f"Failed to parse {len(misses)} chunks: {e}")
+                raise ParseError(f"Failed to parse chunks: {e}") from e
+            
+            failed = []
+            for i, result in zip(misses, results):
+                if isinstance(result, Exception):
+                    failed.append((i, result))
+                    continue
+                chunk_results[i] = result
+                if use_cache:
+                    _chunk_cache_put(self.llm, keys[i], orjson.dumps(result))
+            
+            if failed:
+                i, error = failed[0]
+                logger.error(f"Failed to parse {len(failed)}/{len(chunks)} chunks")
+                raise ParseError(f"Failed to parse chunk {i + 1}/{len(chunks)}: {error}") from error
+        
+        if use_cache and len(misses) < len(chunks):
+            logger.info(f"Reused cached results for {len(chunks) - len(misses)}/{len(chunks)} chunks")
         
         merged_result = self._merge_results(chunk_results)
         return merged_result
@@ -137,24 +193,34 @@ class NovelParserAgent:
         config: NovelParserConfig = self.config  # type: ignore
         chunk_size = config.chunk_size
         
-        paragraphs = text.split("\n\n")
+        # Scan paragraph boundaries in place and slice each chunk straight out
+        # of the text, rather than splitting into a paragraph list and joining
+        # it back together
         chunks = []
-        current_chunk = []
+        chunk_start = 0
         current_length = 0
+        pos = 0
+        text_length = len(text)
         
-        for para in paragraphs:
-            para_length = len(para)
-            if current_length + para_length > chunk_size and current_chunk:
-                chunks.append("\n\n".join(current_chunk))
-                current_chunk = [para]
+        while True:
+            para_end = text.find("\n\n", pos)
+            if para_end == -1:
+                para_end = text_length
+            para_length = para_end - pos
+            
+            if current_length + para_length > chunk_size and pos > chunk_start:
+                # Close the chunk before this paragraph, dropping the separator
+                chunks.append(text[chunk_start:pos - 2])
+                chunk_start = pos
                 current_length = para_length
             else:
-                current_chunk.append(para)
                 current_length += para_length
+            
+            if para_end == text_length:
+                break
+            pos = para_end + 2
         
-        if current_chunk:
-            chunks.append("\n\n".join(current_chunk))
-        
+        chunks.append(text[chunk_start:])
         return chunks
     
     def _merge_results(self, chunk_results: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -166,24 +232,31 @@ class NovelParserAgent:
         chapter_offset = 0
         
         for chunk_result in chunk_results:
-            for char in chunk_result.get("characters", []):
-                character_map[char["name"]].append(char)
+            # Look each section up once per chunk
+            characters = chunk_result.get("characters") or []
+            chapters = chunk_result.get("chapters") or []
+            plot_points = chunk_result.get("plot_points") or []
             
-            for chapter in chunk_result.get("chapters", []):
+            for char in characters:
+                # Chunks can spell the same name with different case or stray
+                # whitespace; group on a normalized key, the first spelling wins
+                character_map[self._character_key(char["name"])].append(char)
+            
+            for chapter in chapters:
                 chapter["chapter_id"] += chapter_offset
                 
-                for scene in chapter.get("scenes", []):
-                    scene["scene_id"] += scene_offset
-                    scene_offset += 1
+                scenes = chapter.get("scenes") or []
+                for index, scene in enumerate(scenes):
+                    scene["scene_id"] += scene_offset + index
+                scene_offset += len(scenes)
                 
                 all_chapters.append(chapter)
             
-            for plot_point in chunk_result.get("plot_points", []):
+            for plot_point in plot_points:
                 plot_point["scene_id"] += scene_offset
-                all_plot_points.append(plot_point)
+            all_plot_points.extend(plot_points)
             
-            if chunk_result.get("chapters"):
-                chapter_offset += len(chunk_result["chapters"])
+            chapter_offset += len(chapters)
         
         merged_characters = []
         for name, occurrences in character_map.items():
@@ -193,47 +266,106 @@ class NovelParserAgent:
                 merged_char = self._merge_character_occurrences(occurrences)
                 merged_characters.append(merged_char)
         
+        # Scenes keep the spelling their own chunk used; point them at the
+        # kept name so later exact-name lookups still find the character
+        canonical_names = {
+            key: occurrences[0]["name"] for key, occurrences in character_map.items()
+        }
+        for chapter in all_chapters:
+            for scene in chapter.get("scenes") or []:
+                self._canonicalize_scene_names(scene, canonical_names)
+        
         return {
             "characters": merged_characters,
             "chapters": all_chapters,
             "plot_points": all_plot_points,
         }
     
+    @staticmethod
+    def _character_key(name: Any) -> Any:
+        return name.strip().casefold() if isinstance(name, str) else name
+    
+    def _canonicalize_scene_names(self, scene: Dict[str, Any], canonical_names: Dict[Any, Any]):
+        def canonical(name: Any) -> Any:
+            return canonical_names.get(self._character_key(name), name)
+        
+        names = scene.get("characters")
+        if names:
+            scene["characters"] = [canonical(name) for name in names]
+        
+        appearances = scene.get("character_appearances")
+        if appearances:
+            scene["character_appearances"] = {
+                canonical(name): appearance for name, appearance in appearances.items()
+            }
+        
+        speaker = scene.get("speaker")
+        if speaker:
+            scene["speaker"] = canonical(speaker)
+    
     def _merge_character_occurrences(self, occurrences: List[Dict[str, Any]]) -> Dict[str, Any]:
         if not occurrences:
             return {}
         
-        base_char = copy.deepcopy(occurrences[0])
-        all_descriptions = []
-        all_personalities = []
+        # Only top-level keys are reassigned below (appearance is rebuilt as a
+        # new dict), so a shallow copy leaves the occurrence untouched
+        base_char = dict(occurrences[0])
+        # Ordered dicts dedupe as they accumulate and keep first-seen order
+        descriptions: Dict[str, None] = {}
+        personalities: Dict[str, None] = {}
+        
+        # key -> (length, value) of the longest value seen so far; each value's
+        # length is computed once. Empty values rank below any non-empty one.
+        best: Dict[str, Tuple[int, Any]] = {
+            key: (self._appearance_value_length(value) if value else -1, value)
+            for key, value in (base_char.get("appearance") or {}).items()
+        }
         
         for occ in occurrences:
-            if occ.get("description"):
-                all_descriptions.append(occ["description"])
+            description = occ.get("description")
+            if description:
+                descriptions[description] = None
             
-            if occ.get("personality"):
-                all_personalities.append(occ["personality"])
+            personality = occ.get("personality")
+            if personality:
+                personalities[personality] = None
             
-            for key, value in occ.get("appearance", {}).items():
-                if value and (not base_char["appearance"].get(key) or 
-                            len(str(value)) > len(str(base_char["appearance"].get(key, "")))):
-                    base_char["appearance"][key] = value
+            for key, value in (occ.get("appearance") or {}).items():
+                if not value:
+                    continue
+                length = self._appearance_value_length(value)
+                current = best.get(key)
+                if current is None or length > current[0]:
+                    best[key] = (length, value)
         
-        if all_descriptions:
-            base_char["description"] = " ".join(set(all_descriptions))
-        if all_personalities:
-            base_char["personality"] = ", ".join(set(all_personalities))
+        base_char["appearance"] = {key: value for key, (_, value) in best.items()}
+        if descriptions:
+            base_char["description"] = " ".join(descriptions)
+        if personalities:
+            base_char["personality"] = ", ".join(personalities)
         
         return base_char
     
+    @staticmethod
+    def _appearance_value_length(value: Any) -> int:
+        return len(value) if isinstance(value, str) else len(str(value))
+    
     def _validate_input(self, novel_text: str):
         config: NovelParserConfig = self.config  # type: ignore
-        if not novel_text or len(novel_text.strip()) < config.min_text_length:
+        text_length = len(novel_text) if novel_text else 0
+        # strip() copies the whole text; only pay for it when there is
+        # leading or trailing whitespace to discount
+        if text_length and (novel_text[0].isspace() or novel_text[-1].isspace()):
+            content_length = len(novel_text.strip())
+        else:
+            content_length = text_length
+        
+        if not novel_text or content_length < config.min_text_length:
             raise ValidationError(
                 f"Novel text too short. Minimum {config.min_text_length} characters required"
             )
         
-        if len(novel_text) > config.max_text_length:
+        if text_length > config.max_text_length:
             raise ValidationError(
                 f"Novel text too long. Maximum {config.max_text_length} characters allowed"
             )
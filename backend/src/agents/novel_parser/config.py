@@ -8,4 +8,6 @@ class NovelParserConfig(BaseModel):
     min_text_length: int = Field(default=100, description="Minimum text length")
     max_text_length: int = Field(default=50000, description="Maximum text length")
     auto_chunk_threshold: int = Field(default=10000, description="Automatically chunk text if length exceeds this threshold")
-    chunk_size: int = Field(default=4000, description="Size of each chunk when splitting text")
\ No newline at end of file
+    chunk_size: int = Field(default=4000, description="Size of each chunk when splitting text")
+    max_concurrency: int = Field(default=8, ge=1, description="Maximum number of chunks parsed by the LLM concurrently")
+    enable_cache: bool = Field(default=True, description="Reuse parse results for identical chunks within the process")
\ No newline at end of file
@@ -1,13 +1,14 @@
 from typing import Dict, List, Optional, Any
 import asyncio
+import errno
 import logging
-import uuid
 import os
 import subprocess
-import json
 import shutil
 from pathlib import Path
 
+import orjson
+
 from .config import SceneComposerConfig
 from ..base import TaskStorageManager
 from ..base.exceptions import ValidationError, CompositionError
@@ -29,10 +30,11 @@ class SceneComposer:
         
         self.task_storage = TaskStorageManager(
             task_id,
-            base_path=self.config.task_storage_base_path
+            base_path=self.config.task_storage_base_path,
+            filename_stamp_length=self.config.uuid_suffix_length,
         )
         
-        self.temp_dir = self.task_storage.temp_dir
+        self.temp_dir = self.task_storage.ensure_temp_dir()
         self.final_output_root = Path(self.config.final_output_dir).resolve()
         self.final_output_root.mkdir(parents=True, exist_ok=True)
         self.final_output_dir = self.final_output_root / self.task_id
@@ -71,9 +73,11 @@ class SceneComposer:
                     "final_video"
                 )
 
-            final_video_path = self._persist_final_video(final_video_path)
+            # Moving across filesystems copies the whole video, so keep it
+            # off the event loop
+            final_video_path = await asyncio.to_thread(self._persist_final_video, final_video_path)
             
-            file_size = os.path.getsize(final_video_path)
+            file_size = await asyncio.to_thread(os.path.getsize, final_video_path)
             duration = await self._get_video_duration(final_video_path)
             
             self.logger.info(f"Successfully composed final video: {final_video_path}")
@@ -119,7 +123,7 @@ class SceneComposer:
     async def _compose_scene(self, scene: RenderedScene) -> str:
         process = None
         try:
-            output_path = self.temp_dir / f"scene_{scene.scene_id}_{uuid.uuid4().hex[:self.config.uuid_suffix_length]}.mp4"
+            output_path = self.temp_dir / self.task_storage.next_filename(f"scene_{scene.scene_id}", "mp4")
             
             if not os.path.exists(scene.image_path):
                 raise CompositionError(f"Image file not found: {scene.image_path}")
@@ -208,7 +212,7 @@ class SceneComposer:
         video_paths: List[str],
         output_name: str
     ) -> str:
-        concat_file = self.temp_dir / f"{output_name}_concat_{uuid.uuid4().hex[:self.config.uuid_suffix_length]}.txt"
+        concat_file = self.temp_dir / self.task_storage.next_filename(f"{output_name}_concat", "txt")
         process = None
         
         try:
@@ -217,7 +221,7 @@ class SceneComposer:
                     abs_video_path = os.path.abspath(video_path)
                     f.write(f"file '{abs_video_path}'\n")
             
-            output_path = self.temp_dir / f"{output_name}_{uuid.uuid4().hex[:self.config.uuid_suffix_length]}.mp4"
+            output_path = self.temp_dir / self.task_storage.next_filename(output_name, "mp4")
             cmd = self._build_concat_ffmpeg_cmd(str(concat_file), str(output_path))
             
             process = await asyncio.create_subprocess_exec(
@@ -262,10 +266,15 @@ class SceneComposer:
             destination_dir.mkdir(parents=True, exist_ok=True)
             
             destination_path = destination_dir / f"final_{self.task_id}.mp4"
-            if destination_path.exists():
-                destination_path.unlink()
-            
-            shutil.move(source_path, destination_path)
+            try:
+                # Atomic rename that overwrites any previous output in one step
+                os.replace(source_path, destination_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # Temp and output dirs on different filesystems: copy instead
+                destination_path.unlink(missing_ok=True)
+                shutil.move(source_path, destination_path)
             self.logger.info(f"Persisted final video to: {destination_path}")
             return str(destination_path)
         except Exception as e:
@@ -311,7 +320,7 @@ class SceneComposer:
                 self.logger.warning("Failed to get video duration, using 0.0")
                 return 0.0
             
-            data = json.loads(stdout.decode())
+            data = orjson.loads(stdout)
             duration = float(data.get("format", {}).get("duration", 0.0))
             
             return duration
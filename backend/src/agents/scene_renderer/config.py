@@ -22,6 +22,12 @@ class SceneRendererConfig(BaseModel):
     
     timeout: int = Field(default=60, description="API请求超时时间（秒）")
     retry_attempts: int = Field(default=3, description="失败重试次数")
+    max_concurrent_scenes: int = Field(default=4, ge=1, description="同时渲染的最大场景数")
+    requests_per_minute: int = Field(
+        default=0,
+        ge=0,
+        description="七牛API每分钟请求上限（图像与语音共享），0表示不限速"
+    )
     
     default_voice_type: str = Field(
         default="qiniu_zh_female_wwxkjx",
@@ -1,16 +1,16 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Awaitable, Callable, List, Mapping
 import asyncio
-import logging
-import uuid
-import base64
-import json
 import hashlib
-import hmac
-from pathlib import Path
-from urllib.parse import urlencode
+import logging
+import random
+import time
+import binascii
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 
-import aiohttp
-from aiohttp import ClientTimeout
+import httpx
+import orjson
 
 from .config import SceneRendererConfig
 from .models import (
@@ -25,44 +25,180 @@ from ..storyboard.models import (
     CharacterRenderInfo,
 )
 from ..base import TaskStorageManager
+from ..base.http_utils import HTTP2_AVAILABLE
 from ..base.exceptions import ValidationError, GenerationError, SynthesisError, APIError
 
 logger = logging.getLogger(__name__)
 
 
-class SceneRenderer:
+VOICE_TYPES = [
+    {"voice_name": "甜美教学小源", "voice_type": "qiniu_zh_female_tmjxxy", "gender": "female", "age_stage": "young"},
+    {"voice_name": "校园清新学姐", "voice_type": "qiniu_zh_female_xyqxxj", "gender": "female", "age_stage": "young"},
+    {"voice_name": "邻家辅导学长", "voice_type": "qiniu_zh_male_ljfdxz", "gender": "male", "age_stage": "young"},
+    {"voice_name": "邻家辅导学姐", "voice_type": "qiniu_zh_female_ljfdxx", "gender": "female", "age_stage": "young"},
+    {"voice_name": "温婉学科讲师", "voice_type": "qiniu_zh_female_wwxkjx", "gender": "female", "age_stage": "adult"},
+    {"voice_name": "率真校园向导", "voice_type": "qiniu_zh_male_szxyxd", "gender": "male", "age_stage": "young"},
+    {"voice_name": "干练课堂思思", "voice_type": "qiniu_zh_female_glktss", "gender": "female", "age_stage": "adult"},
+    {"voice_name": "温和学科小哥", "voice_type": "qiniu_zh_male_whxkxg", "gender": "male", "age_stage": "young"},
+    {"voice_name": "温暖沉稳学长", "voice_type": "qiniu_zh_male_wncwxz", "gender": "male", "age_stage": "young"},
+    {"voice_name": "开朗教学督导", "voice_type": "qiniu_zh_female_kljxdd", "gender": "female", "age_stage": "adult"},
+    {"voice_name": "渊博学科男教师", "voice_type": "qiniu_zh_male_ybxknjs", "gender": "male", "age_stage": "adult"},
+    {"voice_name": "火力少年凯凯", "voice_type": "qiniu_zh_male_hlsnkk", "gender": "male", "age_stage": "child"},
+    {"voice_name": "通用阳光讲师", "voice_type": "qiniu_zh_male_tyygjs", "gender": "male", "age_stage": "adult"},
+    {"voice_name": "知性教学女教师", "voice_type": "qiniu_zh_female_zxjxnjs", "gender": "female", "age_stage": "adult"},
+    {"voice_name": "慈祥教学顾问", "voice_type": "qiniu_zh_female_cxjxgw", "gender": "female", "age_stage": "elder"},
+    {"voice_name": "社区教育阿姨", "voice_type": "qiniu_zh_female_sqjyay", "gender": "female", "age_stage": "elder"},
+    {"voice_name": "动漫樱桃丸子", "voice_type": "qiniu_zh_female_dmytwz", "gender": "female", "age_stage": "child"},
+    {"voice_name": "少儿故事配音", "voice_type": "qiniu_zh_female_segsby", "gender": "female", "age_stage": "child"},
+    {"voice_name": "轻松懒音绵宝", "voice_type": "qiniu_zh_male_qslymb", "gender": "male", "age_stage": "child"},
+    {"voice_name": "活力率真萌仔", "voice_type": "qiniu_zh_male_hllzmz", "gender": "male", "age_stage": "child"},
+    {"voice_name": "温婉课件配音", "voice_type": "qiniu_zh_female_wwkjby", "gender": "female", "age_stage": "adult"},
+    {"voice_name": "儿童故事熊二", "voice_type": "qiniu_zh_male_etgsxe", "gender": "male", "age_stage": "child"},
+    {"voice_name": "古装剧教学版", "voice_type": "qiniu_zh_male_gzjjxb", "gender": "male", "age_stage": "adult"},
+    {"voice_name": "磁性课件男声", "voice_type": "qiniu_zh_male_cxkjns", "gender": "male", "age_stage": "adult"},
+    {"voice_name": "趣味知识传播", "voice_type": "qiniu_zh_female_qwzscb", "gender": "female", "age_stage": "adult"},
+    {"voice_name": "名著角色猴哥", "voice_type": "qiniu_zh_male_mzjsxg", "gender": "male", "age_stage": "adult"},
+    {"voice_name": "英语启蒙佩奇", "voice_type": "qiniu_zh_female_yyqmpq", "gender": "female", "age_stage": "child"},
+    {"voice_name": "天才少年示范", "voice_type": "qiniu_zh_male_tcsnsf", "gender": "male", "age_stage": "child"},
+]
+
+
+@lru_cache(maxsize=1024)
+def _match_voice_type(
+    gender: str,
+    age: Optional[int],
+    age_stage: str,
+    default_voice_type: str,
+) -> str:
+    # Voice choice depends only on these attributes, and the same characters
+    # recur across scenes, tasks and renderer instances, so memoize per process
+    age_category = "adult"
+    if age is not None:
+        if age < 12:
+            age_category = "child"
+        elif age < 25:
+            age_category = "young"
+        elif age >= 60:
+            age_category = "elder"
+        else:
+            age_category = "adult"
+    elif age_stage:
+        if "儿童" in age_stage or "少儿" in age_stage or "child" in age_stage:
+            age_category = "child"
+        elif "青年" in age_stage or "学生" in age_stage or "young" in age_stage:
+            age_category = "young"
+        elif "老年" in age_stage or "elder" in age_stage:
+            age_category = "elder"
+        else:
+            age_category = "adult"
+    
+    matching_voices = [
+        v for v in VOICE_TYPES
+        if v.get("gender") == gender and v.get("age_stage") == age_category
+    ]
     
-    VOICE_TYPES = [
-        {"voice_name": "甜美教学小源", "voice_type": "qiniu_zh_female_tmjxxy", "gender": "female", "age_stage": "young"},
-        {"voice_name": "校园清新学姐", "voice_type": "qiniu_zh_female_xyqxxj", "gender": "female", "age_stage": "young"},
-        {"voice_name": "邻家辅导学长", "voice_type": "qiniu_zh_male_ljfdxz", "gender": "male", "age_stage": "young"},
-        {"voice_name": "邻家辅导学姐", "voice_type": "qiniu_zh_female_ljfdxx", "gender": "female", "age_stage": "young"},
-        {"voice_name": "温婉学科讲师", "voice_type": "qiniu_zh_female_wwxkjx", "gender": "female", "age_stage": "adult"},
-        {"voice_name": "率真校园向导", "voice_type": "qiniu_zh_male_szxyxd", "gender": "male", "age_stage": "young"},
-        {"voice_name": "干练课堂思思", "voice_type": "qiniu_zh_female_glktss", "gender": "female", "age_stage": "adult"},
-        {"voice_name": "温和学科小哥", "voice_type": "qiniu_zh_male_whxkxg", "gender": "male", "age_stage": "young"},
-        {"voice_name": "温暖沉稳学长", "voice_type": "qiniu_zh_male_wncwxz", "gender": "male", "age_stage": "young"},
-        {"voice_name": "开朗教学督导", "voice_type": "qiniu_zh_female_kljxdd", "gender": "female", "age_stage": "adult"},
-        {"voice_name": "渊博学科男教师", "voice_type": "qiniu_zh_male_ybxknjs", "gender": "male", "age_stage": "adult"},
-        {"voice_name": "火力少年凯凯", "voice_type": "qiniu_zh_male_hlsnkk", "gender": "male", "age_stage": "child"},
-        {"voice_name": "通用阳光讲师", "voice_type": "qiniu_zh_male_tyygjs", "gender": "male", "age_stage": "adult"},
-        {"voice_name": "知性教学女教师", "voice_type": "qiniu_zh_female_zxjxnjs", "gender": "female", "age_stage": "adult"},
-        {"voice_name": "慈祥教学顾问", "voice_type": "qiniu_zh_female_cxjxgw", "gender": "female", "age_stage": "elder"},
-        {"voice_name": "社区教育阿姨", "voice_type": "qiniu_zh_female_sqjyay", "gender": "female", "age_stage": "elder"},
-        {"voice_name": "动漫樱桃丸子", "voice_type": "qiniu_zh_female_dmytwz", "gender": "female", "age_stage": "child"},
-        {"voice_name": "少儿故事配音", "voice_type": "qiniu_zh_female_segsby", "gender": "female", "age_stage": "child"},
-        {"voice_name": "轻松懒音绵宝", "voice_type": "qiniu_zh_male_qslymb", "gender": "male", "age_stage": "child"},
-        {"voice_name": "活力率真萌仔", "voice_type": "qiniu_zh_male_hllzmz", "gender": "male", "age_stage": "child"},
-        {"voice_name": "温婉课件配音", "voice_type": "qiniu_zh_female_wwkjby", "gender": "female", "age_stage": "adult"},
-        {"voice_name": "儿童故事熊二", "voice_type": "qiniu_zh_male_etgsxe", "gender": "male", "age_stage": "child"},
-        {"voice_name": "古装剧教学版", "voice_type": "qiniu_zh_male_gzjjxb", "gender": "male", "age_stage": "adult"},
-        {"voice_name": "磁性课件男声", "voice_type": "qiniu_zh_male_cxkjns", "gender": "male", "age_stage": "adult"},
-        {"voice_name": "趣味知识传播", "voice_type": "qiniu_zh_female_qwzscb", "gender": "female", "age_stage": "adult"},
-        {"voice_name": "名著角色猴哥", "voice_type": "qiniu_zh_male_mzjsxg", "gender": "male", "age_stage": "adult"},
-        {"voice_name": "英语启蒙佩奇", "voice_type": "qiniu_zh_female_yyqmpq", "gender": "female", "age_stage": "child"},
-        {"voice_name": "天才少年示范", "voice_type": "qiniu_zh_male_tcsnsf", "gender": "male", "age_stage": "child"},
+    if matching_voices:
+        return matching_voices[0]["voice_type"]
+    
+    gender_voices = [
+        v for v in VOICE_TYPES
+        if v.get("gender") == gender
     ]
     
+    if gender_voices:
+        return gender_voices[0]["voice_type"]
+    
+    return default_voice_type
+
+
+# Encoded silence per duration, shared by all renderer instances so ffmpeg
+# only runs once per process for each configured length
+_SILENT_AUDIO_CACHE: Dict[float, bytes] = {}
+
+
+class _RateLimited(APIError):
+    """A 429/503 response, with the wait the server asked for if any"""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+# Upper bound of the random delay added to each retry so concurrent scenes
+# don't retry in lockstep
+RETRY_JITTER_SECONDS = 1.0
+
+# Cap on a server-requested wait, so one bad or hostile header cannot stall
+# every scene sharing the pacer for hours
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+def _parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Seconds to wait per Retry-After (delta or HTTP date) or X-RateLimit-Reset"""
+    value = headers.get("Retry-After")
+    if value:
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            pass
+    
+    value = headers.get("X-RateLimit-Reset")
+    if value:
+        try:
+            reset = float(value)
+        except ValueError:
+            return None
+        # Some services send an epoch timestamp, others the seconds remaining
+        if reset > 1e9:
+            reset -= time.time()
+        return max(reset, 0.0)
+    
+    return None
+
+
+class _RequestPacer:
+    """Spaces requests evenly so the rate stays just under the provider quota"""
+    
+    def __init__(self, requests_per_minute: int):
+        self._interval = 60.0 / requests_per_minute
+        self._next_slot = 0.0
+    
+    async def acquire(self):
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
+    def defer(self, delay: float):
+        resume_at = asyncio.get_running_loop().time() + delay
+        self._next_slot = max(self._next_slot, resume_at)
+
+
+async def _gather_cancelling(*aws: Awaitable[Any]) -> List[Any]:
+    """
+    Like asyncio.gather, but the first failure cancels the remaining tasks
+    and waits for them to unwind before the error propagates
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+class SceneRenderer:
+    
+    VOICE_TYPES = VOICE_TYPES
+    GENERATION_CACHE_MAX_ENTRIES = 128
+    
     def __init__(
         self,
         task_id: str,
@@ -75,8 +211,66 @@ class SceneRenderer:
             base_path=self.config.task_storage_base_path
         )
         self.character_voice_cache: Dict[str, str] = {}
+        self._silent_audio_task: Optional["asyncio.Future[str]"] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._context_depth = 0
+        self._closed = False
+        self._generation_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._pending_generations: Dict[bytes, "asyncio.Future[str]"] = {}
+        self._pacer = (
+            _RequestPacer(self.config.requests_per_minute)
+            if self.config.requests_per_minute
+            else None
+        )
         logger.info(f"SceneRenderer initialized for task {task_id}")
     
+    async def __aenter__(self) -> "SceneRenderer":
+        """Keeps the HTTP client open across render calls until the block exits"""
+        self._open()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._release()
+    
+    def _open(self):
+        self._context_depth += 1
+        self._closed = False
+    
+    async def _release(self):
+        self._context_depth -= 1
+        if not self._context_depth:
+            await self.aclose()
+    
+    async def aclose(self):
+        """Cancels in-flight generations, then closes the HTTP client"""
+        self._closed = True
+        pending = list(self._pending_generations.values())
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        # One pooled client (HTTP/2 when available) for every Qiniu request
+        if self._closed:
+            raise APIError("SceneRenderer is closed")
+        if self._client is None or self._client.is_closed:
+            # Each concurrent scene has an image and a TTS request in flight
+            limit = self.config.max_concurrent_scenes * 2
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=self.config.timeout,
+                limits=httpx.Limits(
+                    max_connections=limit,
+                    max_keepalive_connections=limit,
+                    keepalive_expiry=75,
+                ),
+            )
+        return self._client
+    
     async def render(self, storyboard: StoryboardResult) -> RenderResult:
         logger.info(f"Starting render for {len(storyboard.chapters)} chapters, {storyboard.total_scenes} scenes")
         
@@ -84,16 +278,20 @@ class SceneRenderer:
         
         self._prepare_character_voices(storyboard)
         
-        rendered_chapters = []
-        total_duration = 0.0
-        total_scenes = 0
-        
-        for chapter in storyboard.chapters:
-            logger.info(f"Rendering chapter {chapter.chapter_id}: {chapter.title}")
-            rendered_chapter = await self._render_chapter(chapter)
-            rendered_chapters.append(rendered_chapter)
-            total_duration += rendered_chapter.total_duration
-            total_scenes += len(rendered_chapter.scenes)
+        # One semaphore for the whole storyboard keeps the scene pipeline full
+        # across chapter boundaries instead of draining at the end of each one
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_scenes)
+        # Hold the client like async with does; it is released only after
+        # every scene task has finished or been cancelled
+        self._open()
+        try:
+            rendered_chapters = await _gather_cancelling(
+                *(self._render_chapter(chapter, semaphore) for chapter in storyboard.chapters)
+            )
+        finally:
+            await self._release()
+        total_duration = sum(chapter.total_duration for chapter in rendered_chapters)
+        total_scenes = sum(len(chapter.scenes) for chapter in rendered_chapters)
         
         result = RenderResult(
             chapters=rendered_chapters,
@@ -105,15 +303,25 @@ class SceneRenderer:
         logger.info(f"Render complete: {total_scenes} scenes, {total_duration:.2f}s total")
         return result
     
-    async def _render_chapter(self, chapter: StoryboardChapter) -> RenderedChapter:
-        rendered_scenes = []
-        chapter_duration = 0.0
+    async def _render_chapter(
+        self,
+        chapter: StoryboardChapter,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> RenderedChapter:
+        logger.info(f"Rendering chapter {chapter.chapter_id}: {chapter.title}")
+        
+        # Scenes are independent network-bound work; the semaphore caps how
+        # many hit the image/TTS APIs at once to stay under rate limits
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.config.max_concurrent_scenes)
+        
+        async def render_one(scene: StoryboardScene) -> RenderedScene:
+            async with semaphore:
+                logger.info(f"Rendering scene {scene.scene_id} in chapter {chapter.chapter_id}")
+                return await self._render_scene(scene)
         
-        for scene in chapter.scenes:
-            logger.info(f"Rendering scene {scene.scene_id} in chapter {chapter.chapter_id}")
-            rendered_scene = await self._render_scene(scene)
-            rendered_scenes.append(rendered_scene)
-            chapter_duration += rendered_scene.duration
+        rendered_scenes = await _gather_cancelling(*(render_one(scene) for scene in chapter.scenes))
+        chapter_duration = sum(scene.duration for scene in rendered_scenes)
         
         return RenderedChapter(
             chapter_id=chapter.chapter_id,
@@ -124,8 +332,11 @@ class SceneRenderer:
     
     async def _render_scene(self, scene: StoryboardScene) -> RenderedScene:
         try:
-            image_path = await self._generate_image(scene)
-            audio_path = await self._generate_audio(scene)
+            # Image and audio come from independent APIs, so request both at once
+            image_path, audio_path = await _gather_cancelling(
+                self._generate_image(scene),
+                self._generate_audio(scene),
+            )
         except Exception as e:
             logger.error(f"Failed to render scene {scene.scene_id}: {e}")
             raise GenerationError(f"Scene {scene.scene_id} rendering failed") from e
@@ -153,19 +364,23 @@ class SceneRenderer:
     
     async def _generate_image(self, scene: StoryboardScene) -> str:
         prompt = self._build_image_prompt(scene)
-        
+        cache_key = self._generation_key("image", self.config.image_model, self.config.image_size, prompt)
+        return await self._coalesce(cache_key, lambda: self._request_image(scene, prompt, cache_key))
+    
+    async def _request_image(self, scene: StoryboardScene, prompt: str, cache_key: bytes) -> str:
         for attempt in range(self.config.retry_attempts):
             try:
                 image_data = await self._call_image_generation_api(prompt)
-                filename = f"scene_{scene.chapter_id}_{scene.scene_id}_{uuid.uuid4()}.png"
+                filename = self.task_storage.next_filename(f"scene_{scene.chapter_id}_{scene.scene_id}", "png")
                 image_path = await self.task_storage.save_image(image_data, filename)
+                self._generation_cache_put(cache_key, image_path)
                 logger.info(f"Image generated for scene {scene.scene_id}: {image_path}")
                 return image_path
             except Exception as e:
                 logger.warning(f"Image generation attempt {attempt + 1}/{self.config.retry_attempts} failed: {e}")
                 if attempt == self.config.retry_attempts - 1:
                     raise GenerationError(f"Failed to generate image for scene {scene.scene_id}") from e
-                await asyncio.sleep(2 ** attempt)
+                await asyncio.sleep(self._retry_delay(e, attempt))
         
         raise GenerationError(f"Failed to generate image for scene {scene.scene_id}")
     
@@ -176,45 +391,119 @@ class SceneRenderer:
             return await self._generate_silent_audio()
         
         voice_type = self._select_voice_type(scene)
-        
+        cache_key = self._generation_key(
+            "tts", voice_type, self.config.tts_encoding, str(self.config.tts_speed_ratio), text
+        )
+        return await self._coalesce(
+            cache_key, lambda: self._request_audio(scene, text, voice_type, cache_key)
+        )
+    
+    async def _request_audio(
+        self,
+        scene: StoryboardScene,
+        text: str,
+        voice_type: str,
+        cache_key: bytes,
+    ) -> str:
         for attempt in range(self.config.retry_attempts):
             try:
                 audio_data = await self._call_tts_api(text, voice_type)
-                filename = f"audio_{scene.chapter_id}_{scene.scene_id}_{uuid.uuid4()}.mp3"
+                filename = self.task_storage.next_filename(f"audio_{scene.chapter_id}_{scene.scene_id}", "mp3")
                 audio_path = await self.task_storage.save_audio(audio_data, filename)
+                self._generation_cache_put(cache_key, audio_path)
                 logger.info(f"Audio generated for scene {scene.scene_id}: {audio_path}")
                 return audio_path
             except Exception as e:
                 logger.warning(f"Audio generation attempt {attempt + 1}/{self.config.retry_attempts} failed: {e}")
                 if attempt == self.config.retry_attempts - 1:
                     raise SynthesisError(f"Failed to generate audio for scene {scene.scene_id}") from e
-                await asyncio.sleep(2 ** attempt)
+                await asyncio.sleep(self._retry_delay(e, attempt))
         
         raise SynthesisError(f"Failed to generate audio for scene {scene.scene_id}")
     
+    async def _coalesce(self, cache_key: bytes, request: Callable[[], Awaitable[str]]) -> str:
+        """Reuses a finished or in-flight generation with the same parameters"""
+        cached_path = self._generation_cache_get(cache_key)
+        if cached_path is not None:
+            logger.debug(f"Reusing generated file: {cached_path}")
+            return cached_path
+        
+        task = self._pending_generations.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(request())
+            self._pending_generations[cache_key] = task
+            task.add_done_callback(lambda _: self._pending_generations.pop(cache_key, None))
+        # A cancelled waiter must not cancel a request other scenes share
+        return await asyncio.shield(task)
+    
+    @staticmethod
+    def _generation_key(*parts: str) -> bytes:
+        return hashlib.sha256("\x1f".join(parts).encode()).digest()
+    
+    def _generation_cache_get(self, key: bytes) -> Optional[str]:
+        path = self._generation_cache.get(key)
+        if path is not None:
+            self._generation_cache.move_to_end(key)
+        return path
+    
+    def _generation_cache_put(self, key: bytes, path: str):
+        self._generation_cache[key] = path
+        self._generation_cache.move_to_end(key)
+        if len(self._generation_cache) > self.GENERATION_CACHE_MAX_ENTRIES:
+            self._generation_cache.popitem(last=False)
+    
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        jitter = random.uniform(0, RETRY_JITTER_SECONDS)
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is None:
+            return 2 ** attempt + jitter
+        retry_after = min(retry_after, MAX_RETRY_AFTER_SECONDS)
+        if self._pacer is not None:
+            self._pacer.defer(retry_after)
+        return retry_after + jitter
+    
+    async def _acquire_request_slot(self):
+        if self._pacer is not None:
+            await self._pacer.acquire()
+    
     def _build_image_prompt(self, scene: StoryboardScene) -> str:
         base_prompt = scene.image.prompt or scene.description
         
         if not base_prompt:
             raise ValidationError(f"Scene {scene.scene_id} has no image prompt or description")
         
-        style_tags = ", ".join(scene.image.style_tags) if scene.image.style_tags else "anime style"
+        image = scene.image
+        style_tags = ", ".join(image.style_tags) if image.style_tags else "anime style"
         
-        subtitle_instruction = ""
+        subtitle_instruction = None
         if scene.audio.type == "dialogue" and scene.audio.text:
-            subtitle_instruction = f", with subtitle text '{scene.audio.text}' displayed at the bottom of the image in a clear, readable font"
-        
-        full_prompt = f"{base_prompt}, {style_tags}, {scene.image.shot_type}, {scene.image.camera_angle}, {scene.image.composition}, {scene.image.lighting}{subtitle_instruction}, high quality"
-        
-        return full_prompt
+            subtitle_instruction = f"with subtitle text '{scene.audio.text}' displayed at the bottom of the image in a clear, readable font"
+        
+        # Single pass over the fields; empty ones are skipped rather than
+        # leaving ", ," gaps in the prompt
+        return ", ".join(
+            part
+            for part in (
+                base_prompt,
+                style_tags,
+                image.shot_type,
+                image.camera_angle,
+                image.composition,
+                image.lighting,
+                subtitle_instruction,
+                "high quality",
+            )
+            if part
+        )
     
     def _select_voice_type(self, scene: StoryboardScene) -> str:
         if scene.audio.type == "narration":
             return self.config.narrator_voice_type
         
         speaker = scene.audio.speaker
-        if speaker and speaker in self.character_voice_cache:
-            return self.character_voice_cache[speaker]
+        cached = self.character_voice_cache.get(speaker) if speaker else None
+        if cached is not None:
+            return cached
         
         character = None
         for char in scene.characters:
@@ -231,47 +520,12 @@ class SceneRenderer:
         return self.config.default_voice_type
     
     def _match_voice_by_character(self, character: CharacterRenderInfo) -> str:
-        gender = character.gender.lower()
-        age = character.age
-        age_stage = character.age_stage.lower()
-        
-        age_category = "adult"
-        if age is not None:
-            if age < 12:
-                age_category = "child"
-            elif age < 25:
-                age_category = "young"
-            elif age >= 60:
-                age_category = "elder"
-            else:
-                age_category = "adult"
-        elif age_stage:
-            if "儿童" in age_stage or "少儿" in age_stage or "child" in age_stage:
-                age_category = "child"
-            elif "青年" in age_stage or "学生" in age_stage or "young" in age_stage:
-                age_category = "young"
-            elif "老年" in age_stage or "elder" in age_stage:
-                age_category = "elder"
-            else:
-                age_category = "adult"
-        
-        matching_voices = [
-            v for v in self.VOICE_TYPES
-            if v.get("gender") == gender and v.get("age_stage") == age_category
-        ]
-        
-        if matching_voices:
-            return matching_voices[0]["voice_type"]
-        
-        gender_voices = [
-            v for v in self.VOICE_TYPES
-            if v.get("gender") == gender
-        ]
-        
-        if gender_voices:
-            return gender_voices[0]["voice_type"]
-        
-        return self.config.default_voice_type
+        return _match_voice_type(
+            character.gender.lower(),
+            character.age,
+            character.age_stage.lower(),
+            self.config.default_voice_type,
+        )
     
     def _prepare_character_voices(self, storyboard: StoryboardResult):
         for chapter in storyboard.chapters:
@@ -286,6 +540,26 @@ class SceneRenderer:
                                 logger.info(f"Assigned voice {voice_type} to character {speaker}")
                                 break
     
+    async def _post_qiniu(self, path: str, params: Dict[str, Any], api_name: str) -> Dict[str, Any]:
+        headers = {
+            "Authorization": f"Bearer {self.config.qiniu_api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        url = f"{self.config.qiniu_endpoint}{path}"
+        
+        await self._acquire_request_slot()
+        response = await self._get_client().post(url, content=orjson.dumps(params), headers=headers)
+        if response.status_code in (429, 503):
+            raise _RateLimited(
+                f"Qiniu {api_name} API rate limited: {response.status_code} - {response.text}",
+                retry_after=_parse_retry_after(response.headers),
+            )
+        if response.status_code != 200:
+            raise APIError(f"Qiniu {api_name} API error: {response.status_code} - {response.text}")
+        
+        return orjson.loads(response.content)
+    
     async def _call_image_generation_api(self, prompt: str) -> bytes:
         params = {
             "model": self.config.image_model,
@@ -293,32 +567,16 @@ class SceneRenderer:
             "size": self.config.image_size,
         }
         
-        headers = {
-            "Authorization": f"Bearer {self.config.qiniu_api_key}",
-            "Content-Type": "application/json"
-        }
+        result = await self._post_qiniu("/v1/images/generations", params, "Image")
         
-        url = f"{self.config.qiniu_endpoint}/v1/images/generations"
+        if "data" not in result or not result["data"]:
+            raise GenerationError("Invalid response from Qiniu API: no image data")
         
-        timeout = ClientTimeout(total=self.config.timeout)
+        image_b64 = result["data"][0].get("b64_json")
+        if not image_b64:
+            raise GenerationError("Invalid response from Qiniu API: no base64 image data")
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=params, headers=headers, timeout=timeout) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise APIError(f"Qiniu Image API error: {response.status} - {error_text}")
-                
-                result = await response.json()
-                
-                if "data" not in result or not result["data"]:
-                    raise GenerationError("Invalid response from Qiniu API: no image data")
-                
-                image_b64 = result["data"][0].get("b64_json")
-                if not image_b64:
-                    raise GenerationError("Invalid response from Qiniu API: no base64 image data")
-                
-                image_data = base64.b64decode(image_b64)
-                return image_data
+        return binascii.a2b_base64(image_b64)
     
     async def _call_tts_api(self, text: str, voice_type: str) -> bytes:
         params = {
@@ -332,46 +590,41 @@ class SceneRenderer:
             }
         }
         
-        headers = {
-            "Authorization": f"Bearer {self.config.qiniu_api_key}",
-            "Content-Type": "application/json"
-        }
+        result = await self._post_qiniu("/v1/voice/tts", params, "TTS")
         
-        url = f"{self.config.qiniu_endpoint}/v1/voice/tts"
+        if "data" not in result:
+            raise SynthesisError("Invalid response from Qiniu TTS API: no audio data")
         
-        timeout = ClientTimeout(total=self.config.timeout)
+        audio_b64 = result["data"]
+        if not audio_b64:
+            raise SynthesisError("Invalid response from Qiniu TTS API: no base64 audio data")
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=params, headers=headers, timeout=timeout) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise APIError(f"Qiniu TTS API error: {response.status} - {error_text}")
-                
-                result = await response.json()
-                
-                if "data" not in result:
-                    raise SynthesisError("Invalid response from Qiniu TTS API: no audio data")
-                
-                audio_b64 = result["data"]
-                if not audio_b64:
-                    raise SynthesisError("Invalid response from Qiniu TTS API: no base64 audio data")
-                
-                audio_data = base64.b64decode(audio_b64)
-                return audio_data
+        return binascii.a2b_base64(audio_b64)
     
     async def _generate_silent_audio(self) -> str:
+        # Every silent scene in a task shares one file
+        if self._silent_audio_task is None:
+            self._silent_audio_task = asyncio.ensure_future(self._write_silent_audio())
+        return await asyncio.shield(self._silent_audio_task)
+    
+    async def _write_silent_audio(self) -> str:
+        duration = self.config.silent_audio_duration
+        cached = _SILENT_AUDIO_CACHE.get(duration)
+        if cached is not None:
+            return await self.task_storage.save_audio(cached, self.task_storage.next_filename("silent", "mp3"))
+        
         try:
             import subprocess
             
-            filename = f"silent_{uuid.uuid4()}.mp3"
-            temp_path = self.task_storage.temp_dir / filename
+            filename = self.task_storage.next_filename("silent", "mp3")
+            temp_path = self.task_storage.ensure_temp_dir() / filename
             
             cmd = [
                 "ffmpeg",
                 "-y",
                 "-f", "lavfi",
                 "-i", "anullsrc=channel_layout=stereo:sample_rate=44100",
-                "-t", str(self.config.silent_audio_duration),
+                "-t", str(duration),
                 "-q:a", "9",
                 str(temp_path)
             ]
@@ -387,18 +640,20 @@ class SceneRenderer:
             if process.returncode != 0:
                 error_msg = stderr.decode() if stderr else "Unknown error"
                 logger.warning(f"FFmpeg silent audio generation failed: {error_msg}")
-                temp_path.write_bytes(b"")
+                audio_data = b""
+            else:
+                audio_data = await asyncio.to_thread(temp_path.read_bytes)
+                _SILENT_AUDIO_CACHE[duration] = audio_data
             
-            final_path = await self.task_storage.save_audio(temp_path.read_bytes(), filename)
+            final_path = await self.task_storage.save_audio(audio_data, filename)
             
-            if temp_path.exists():
-                temp_path.unlink()
+            await asyncio.to_thread(temp_path.unlink, missing_ok=True)
             
             return final_path
             
         except Exception as e:
             logger.warning(f"Failed to generate silent audio: {e}")
-            filename = f"silent_{uuid.uuid4()}.mp3"
+            filename = self.task_storage.next_filename("silent", "mp3")
             return await self.task_storage.save_audio(b"", filename)
     
     async def _get_audio_duration(self, audio_path: str) -> float:
@@ -433,6 +688,9 @@ class SceneRenderer:
             return 3.0
     
     def _validate_storyboard(self, storyboard: StoryboardResult):
+        if not isinstance(storyboard, StoryboardResult):
+            raise ValidationError("Input must be a StoryboardResult instance")
+        
         if not storyboard.chapters:
             raise ValidationError("Storyboard must contain at least one chapter")
         
@@ -49,9 +49,28 @@ class StoryboardAgent:
             logger.error(f"Failed to parse NovelParseResult: {e}")
             raise ValidationError(f"Invalid NovelParseResult format: {e}") from e
         
-        result = await self._convert_to_storyboard(novel_result, options)
+        result = await self.create_storyboard(novel_result, options)
         return result.model_dump()
     
+    async def create_storyboard(
+        self,
+        novel_result: NovelParseResult,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> StoryboardResult:
+        """
+        基于已校验的解析结果创建分镜，直接返回模型
+        
+        供流水线内部使用，省去 model_dump 与重新校验的往返。
+        
+        Args:
+            novel_result: 小说解析结果
+            options: 可选配置参数
+        
+        Returns:
+            StoryboardResult: 分镜结果
+        """
+        return await self._convert_to_storyboard(novel_result, options)
+    
     async def _convert_to_storyboard(
         self,
         novel_result: NovelParseResult,
@@ -61,6 +80,18 @@ class StoryboardAgent:
         total_duration = 0.0
         total_scenes = 0
         
+        # Built once per novel rather than once per scene
+        character_map = {char.name: char for char in novel_result.characters}
+        # 全局外貌对应的渲染信息与提示词片段只计算一次，供无场景覆盖的角色复用
+        character_renders = {
+            char.name: self._build_render_info(char.name, char.appearance, char)
+            for char in novel_result.characters
+        }
+        character_prompts = {
+            name: self._build_character_prompt(render_info)
+            for name, render_info in character_renders.items()
+        }
+        
         for chapter in novel_result.chapters:
             storyboard_scenes = []
             
@@ -69,7 +100,9 @@ class StoryboardAgent:
                     storyboard_scene = self._convert_scene(
                         scene=scene,
                         chapter_id=chapter.chapter_id,
-                        global_characters=novel_result.characters,
+                        character_map=character_map,
+                        character_renders=character_renders,
+                        character_prompts=character_prompts,
                     )
                     storyboard_scenes.append(storyboard_scene)
                     total_duration += storyboard_scene.duration
@@ -102,11 +135,14 @@ class StoryboardAgent:
         self,
         scene: Any,
         chapter_id: int,
-        global_characters: List[CharacterInfo],
+        character_map: Dict[str, CharacterInfo],
+        character_renders: Optional[Dict[str, CharacterRenderInfo]] = None,
+        character_prompts: Optional[Dict[str, str]] = None,
     ) -> StoryboardScene:
         characters = self._merge_character_info(
             scene=scene,
-            global_characters=global_characters,
+            character_map=character_map,
+            character_renders=character_renders,
         )
         
         audio = self._create_audio_info(scene)
@@ -114,6 +150,7 @@ class StoryboardAgent:
         image = self._create_image_info(
             scene=scene,
             characters=characters,
+            character_prompts=character_prompts,
         )
         
         duration = self._calculate_scene_duration(audio)
@@ -135,15 +172,19 @@ class StoryboardAgent:
     def _merge_character_info(
         self,
         scene: Any,
-        global_characters: List[CharacterInfo],
+        character_map: Dict[str, CharacterInfo],
+        character_renders: Optional[Dict[str, CharacterRenderInfo]] = None,
     ) -> List[CharacterRenderInfo]:
-        character_map = {char.name: char for char in global_characters}
-        
+        character_renders = character_renders or {}
         result = []
         for char_name in scene.characters:
-            global_char = character_map.get(char_name)
             scene_appearance = scene.character_appearances.get(char_name)
             
+            if not scene_appearance and char_name in character_renders:
+                result.append(character_renders[char_name])
+                continue
+            
+            global_char = character_map.get(char_name)
             if scene_appearance:
                 appearance = scene_appearance
             elif global_char:
@@ -151,25 +192,41 @@ class StoryboardAgent:
             else:
                 appearance = CharacterAppearance()
             
-            render_info = CharacterRenderInfo(
-                name=char_name,
-                gender=appearance.gender or "unknown",
-                age=appearance.age,
-                age_stage=appearance.age_stage or "",
-                hair=appearance.hair or "",
-                eyes=appearance.eyes or "",
-                clothing=appearance.clothing or "",
-                features=appearance.features or "",
-                body_type=appearance.body_type or "",
-                height=appearance.height or "",
-                skin=appearance.skin or "",
-                personality=global_char.personality if global_char else "",
-                role=global_char.role if global_char else "",
-            )
-            result.append(render_info)
+            result.append(self._build_render_info(char_name, appearance, global_char))
         
         return result
     
+    def _build_render_info(
+        self,
+        name: str,
+        appearance: CharacterAppearance,
+        global_char: Optional[CharacterInfo],
+    ) -> CharacterRenderInfo:
+        return CharacterRenderInfo(
+            name=name,
+            gender=appearance.gender or "unknown",
+            age=appearance.age,
+            age_stage=appearance.age_stage or "",
+            hair=appearance.hair or "",
+            eyes=appearance.eyes or "",
+            clothing=appearance.clothing or "",
+            features=appearance.features or "",
+            body_type=appearance.body_type or "",
+            height=appearance.height or "",
+            skin=appearance.skin or "",
+            personality=global_char.personality if global_char else "",
+            role=global_char.role if global_char else "",
+        )
+    
+    def _build_character_prompt(self, char: CharacterRenderInfo) -> str:
+        gender = char.gender if char.gender != "unknown" else None
+        char_desc = ", ".join(
+            part
+            for part in (gender, char.age_stage, char.hair, char.clothing, char.features)
+            if part
+        )
+        return f"{char.name}, {char_desc}" if char_desc else ""
+    
     def _create_audio_info(self, scene: Any) -> AudioInfo:
         if scene.content_type == "dialogue":
             text = scene.dialogue_text or ""
@@ -194,7 +251,9 @@ class StoryboardAgent:
         self,
         scene: Any,
         characters: List[CharacterRenderInfo],
+        character_prompts: Optional[Dict[str, str]] = None,
     ) -> ImageRenderInfo:
+        character_prompts = character_prompts or {}
         prompt_parts = ["anime style"]
         
         if scene.description:
@@ -213,20 +272,12 @@ class StoryboardAgent:
             prompt_parts.append(f"lighting: {scene.lighting}")
         
         for char in characters:
-            char_desc_parts = [char.name]
-            if char.gender and char.gender != "unknown":
-                char_desc_parts.append(char.gender)
-            if char.age_stage:
-                char_desc_parts.append(char.age_stage)
-            if char.hair:
-                char_desc_parts.append(char.hair)
-            if char.clothing:
-                char_desc_parts.append(char.clothing)
-            if char.features:
-                char_desc_parts.append(char.features)
-            
-            if len(char_desc_parts) > 1:
-                prompt_parts.append(", ".join(char_desc_parts))
+            if scene.character_appearances.get(char.name) or char.name not in character_prompts:
+                char_prompt = self._build_character_prompt(char)
+            else:
+                char_prompt = character_prompts[char.name]
+            if char_prompt:
+                prompt_parts.append(char_prompt)
         
         if scene.character_action:
             prompt_parts.append(scene.character_action)
@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -6,16 +7,26 @@ import os
 
 from .routes import router
 from .config import api_config
+from ..agents.base.download_utils import close_session, warm_up_connections
 
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await warm_up_connections(api_config.get_download_warm_urls())
+    yield
+    await close_session()
+
+
 app = FastAPI(
     title="智能动漫生成系统 API",
     description="将小说文本转换为动漫视频的智能系统",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
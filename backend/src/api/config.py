@@ -25,6 +25,15 @@ class APIConfig(BaseModel):
         description="Backend base URL for generating absolute URLs (e.g., http://localhost:8000). Set to empty string to use relative URLs."
     )
     
+    download_warm_urls: str = Field(
+        default="",
+        description="Comma-separated URLs of frequently downloaded hosts to pre-connect at startup"
+    )
+    
+    def get_download_warm_urls(self) -> list:
+        """Get the list of URLs to warm up download connections for"""
+        return [url.strip() for url in self.download_warm_urls.split(",") if url.strip()]
+    
     def get_media_root_path(self) -> str:
         """Get absolute path to media root directory"""
         return os.path.abspath(self.media_root)
@@ -71,5 +80,6 @@ api_config = APIConfig(
     media_root=os.getenv("MEDIA_ROOT", "./data"),
     media_url_prefix=os.getenv("MEDIA_URL_PREFIX", "/static"),
     exposed_media_subdir=os.getenv("EXPOSED_MEDIA_SUBDIR", "videos"),
-    backend_base_url=os.getenv("BACKEND_BASE_URL", "http://localhost:8000")
+    backend_base_url=os.getenv("BACKEND_BASE_URL", "http://localhost:8000"),
+    download_warm_urls=os.getenv("DOWNLOAD_WARM_URLS", "")
 )
@@ -4,8 +4,11 @@ from datetime import datetime
 import logging
 import asyncio
 import os
+import time
 from typing import Dict, Any, Optional
 
+import orjson
+
 from .schemas import (
     NovelUploadRequest,
     NovelUploadResponse,
@@ -55,15 +58,14 @@ async def _cleanup_old_tasks():
     清理超过TTL的已完成或失败任务
     """
     try:
-        current_time = datetime.utcnow()
+        # Monotonic deadlines are immune to wall-clock jumps and need no
+        # datetime arithmetic per entry
+        now = time.monotonic()
         async with get_task_results_lock():
-            tasks_to_remove = []
-            for task_id, task_data in task_results.items():
-                completed_at = task_data.get("completed_at")
-                if completed_at:
-                    age_seconds = (current_time - completed_at).total_seconds()
-                    if age_seconds > TASK_TTL_SECONDS:
-                        tasks_to_remove.append(task_id)
+            tasks_to_remove = [
+                task_id for task_id, task_data in task_results.items()
+                if task_data.get("expires_at", now) < now
+            ]
             
             for task_id in tasks_to_remove:
                 del task_results[task_id]
@@ -98,7 +100,7 @@ async def process_novel_task(
             task_results[str(task_id)] = {
                 "status": "completed",
                 "result": result,
-                "completed_at": datetime.utcnow()
+                "expires_at": time.monotonic() + TASK_TTL_SECONDS
             }
         
         # Send complete message with full video metadata via WebSocket
@@ -120,7 +122,7 @@ async def process_novel_task(
             task_results[str(task_id)] = {
                 "status": "failed",
                 "error": str(e),
-                "completed_at": datetime.utcnow()
+                "expires_at": time.monotonic() + TASK_TTL_SECONDS
             }
         
         await progress_tracker.fail(
@@ -243,8 +245,7 @@ async def websocket_progress(websocket: WebSocket, task_id: UUID):
         
         current_progress = await progress_tracker.get_progress(task_id)
         if current_progress:
-            import json
-            await websocket.send_text(json.dumps(current_progress))
+            await websocket.send_text(orjson.dumps(current_progress).decode())
         
         while True:
             try:
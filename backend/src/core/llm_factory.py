@@ -1,38 +1,21 @@
 from typing import Dict, Any, Optional, Literal
 import os
-from enum import Enum
+from functools import lru_cache
 
+import httpx
 from langchain_openai import ChatOpenAI
 from openai import AsyncOpenAI
 
+from ..agents.base.http_utils import HTTP2_AVAILABLE
+# The capability table lives beside the LLM helpers so agents can consult it
+# without importing core (which imports the agents)
+from ..agents.base.llm_capabilities import LLMCapability, LLMType, LLM_CAPABILITIES
 
-class LLMCapability(Enum):
-    JSON_MODE = "json_mode"
-    IMAGE_GENERATION = "image_generation"
-    AUDIO_GENERATION = "audio_generation"
-    TEXT_GENERATION = "text_generation"
-
-
-class LLMType(Enum):
-    GPT4O = "gpt-4o"
-    GPT4O_MINI = "gpt-4o-mini"
-    GPT35_TURBO = "gpt-3.5-turbo"
-
-
-LLM_CAPABILITIES: Dict[LLMType, list[LLMCapability]] = {
-    LLMType.GPT4O: [
-        LLMCapability.JSON_MODE,
-        LLMCapability.TEXT_GENERATION,
-    ],
-    LLMType.GPT4O_MINI: [
-        LLMCapability.JSON_MODE,
-        LLMCapability.TEXT_GENERATION,
-    ],
-    LLMType.GPT35_TURBO: [
-        LLMCapability.JSON_MODE,
-        LLMCapability.TEXT_GENERATION,
-    ],
-}
+# Parallel chunk parsing fans out many requests to one host; keep enough idle
+# connections (or HTTP/2 streams) around that none of them re-handshake.
+LLM_MAX_CONNECTIONS = 64
+LLM_MAX_KEEPALIVE_CONNECTIONS = 32
+LLM_KEEPALIVE_SECONDS = 75
 
 
 AGENT_LLM_MAPPING: Dict[str, LLMType] = {
@@ -42,6 +25,40 @@ AGENT_LLM_MAPPING: Dict[str, LLMType] = {
 }
 
 
+@lru_cache(maxsize=32)
+def _cached_chat_llm(
+    model: str,
+    api_key: Optional[str],
+    base_url: Optional[str],
+    temperature: Optional[float],
+    timeout: Optional[float],
+) -> ChatOpenAI:
+    # ChatOpenAI owns its HTTP clients and is safe to share across concurrent
+    # ainvoke calls, so identical configurations reuse a single instance.
+    return ChatOpenAI(
+        model=model,
+        api_key=api_key,
+        base_url=base_url,
+        temperature=temperature,
+        timeout=timeout,
+        http_async_client=_create_async_http_client(),
+    )
+
+
+def _create_async_http_client() -> httpx.AsyncClient:
+    # Timeouts come from ChatOpenAI per request; leave the client unbounded
+    # like the default one it replaces.
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=None,
+        limits=httpx.Limits(
+            max_connections=LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=LLM_KEEPALIVE_SECONDS,
+        ),
+    )
+
+
 class LLMFactory:
     
     @staticmethod
@@ -62,11 +79,19 @@ class LLMFactory:
         
         api_key = api_key or os.getenv("OPENAI_API_KEY")
         
-        return ChatOpenAI(
-            model=llm_type.value,
-            temperature=temperature,
-            api_key=api_key,
-        )
+        return _cached_chat_llm(llm_type.value, api_key, None, temperature, None)
+    
+    @staticmethod
+    def get_chat_llm(
+        model: str,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> ChatOpenAI:
+        api_key = api_key or os.getenv("OPENAI_API_KEY")
+        
+        return _cached_chat_llm(model, api_key, base_url, temperature, timeout)
     
     @staticmethod
     def create_openai_client(api_key: Optional[str] = None) -> AsyncOpenAI:
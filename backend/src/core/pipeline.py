@@ -8,14 +8,13 @@ import os
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from langchain_openai import ChatOpenAI
-
 from agents.novel_parser import NovelParserAgent, NovelParserConfig
 from agents.storyboard import StoryboardAgent, StoryboardConfig
 from agents.scene_renderer import SceneRenderer, SceneRendererConfig
 from agents.scene_composer import SceneComposer, SceneComposerConfig
 
 from .progress_tracker import ProgressTracker
+from .llm_factory import LLMFactory
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +35,7 @@ class AnimePipeline:
     def __init__(self, api_key, progress_tracker, task_id):
         self.id = task_id
         
-        self.llm = ChatOpenAI(
+        self.llm = LLMFactory.get_chat_llm(
             model="claude-4.5-sonnet",
             api_key=api_key,
             base_url="https://openai.qiniu.com/v1",
@@ -101,16 +100,16 @@ class AnimePipeline:
         logger.info("小说解析完成")
         
         logger.info("2. 开始分镜设计...")
-        novel_data_dict = novel_result.model_dump()
-        storyboard_data = await self.storyboard.create(novel_data_dict)
+        # Hand the validated models straight through instead of dumping to
+        # dicts and re-validating them at each stage boundary
+        storyboard_result = await self.storyboard.create_storyboard(novel_result)
         await self.progress_tracker.update(self.id, "scene_extraction", 30, "场景提取完成")
         logger.info("分镜设计完成")
         
         logger.info("3. 开始渲染场景（生成图片和音频）...")
         await self.progress_tracker.update(self.id, "scene_rendering", 40, "场景渲染中")
-        from agents.storyboard.models import StoryboardResult
-        storyboard_result = StoryboardResult(**storyboard_data)
-        logger.info(f"场景渲染数据: {storyboard_result.model_dump()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("场景渲染数据: %s", storyboard_result.model_dump())
         render_result = await self.scene_renderer.render(storyboard_result)
         await self.progress_tracker.update(self.id, "scene_rendering", 70, "场景渲染完成")
         logger.info(f"场景渲染完成: {render_result.total_scenes} 个场景")
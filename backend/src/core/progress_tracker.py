@@ -1,9 +1,11 @@
-from typing import Dict, Any, Optional, Set
+from typing import Dict, Any, Optional, Set, Tuple
 from uuid import UUID
-import json
 import logging
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 import asyncio
+import time
+
+import orjson
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
@@ -18,15 +20,20 @@ class ProgressTracker:
     
     Attributes:
         redis: Redis客户端实例（可选），用于发布/存储进度数据
-        _memory_storage: 内存存储，存储进度数据
+        _memory_storage: 内存存储，按LRU顺序保存进度数据及其过期时间
         _lock: 异步锁，保证内存存储的线程安全
         _use_redis: 是否使用Redis
         _websocket_connections: WebSocket连接管理，存储每个项目的活跃连接
     """
     
+    # Same TTL as the Redis copy; the entry cap bounds memory in
+    # long-running servers that never see a task's progress read again
+    PROGRESS_TTL_SECONDS = 3600
+    MEMORY_MAX_ENTRIES = 1024
+    
     def __init__(self, redis_client=None):
         self.redis = redis_client
-        self._memory_storage: Dict[str, Dict[str, Any]] = {}
+        self._memory_storage: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
         self._lock = asyncio.Lock()
         self._use_redis = redis_client is not None
         self._websocket_connections: Dict[str, Set[WebSocket]] = defaultdict(set)
@@ -146,6 +153,25 @@ class ProgressTracker:
         await self._publish_progress(project_id, progress_data)
         await self._save_progress(project_id, progress_data)
     
+    def _memory_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """读取内存进度，过期条目会被移除（调用方需持有锁）"""
+        entry = self._memory_storage.get(key)
+        if entry is None:
+            return None
+        progress_data, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._memory_storage[key]
+            return None
+        self._memory_storage.move_to_end(key)
+        return progress_data
+    
+    def _memory_set(self, key: str, progress_data: Dict[str, Any]):
+        """写入内存进度，超出容量时淘汰最久未使用的条目（调用方需持有锁）"""
+        self._memory_storage[key] = (progress_data, time.monotonic() + self.PROGRESS_TTL_SECONDS)
+        self._memory_storage.move_to_end(key)
+        while len(self._memory_storage) > self.MEMORY_MAX_ENTRIES:
+            self._memory_storage.popitem(last=False)
+    
     async def get_progress(self, project_id: UUID) -> Optional[Dict[str, Any]]:
         """
         获取项目当前进度
@@ -161,17 +187,18 @@ class ProgressTracker:
         key = str(project_id)
         
         async with self._lock:
-            if key in self._memory_storage:
-                return self._memory_storage[key]
+            progress_data = self._memory_get(key)
+        if progress_data is not None:
+            return progress_data
         
         if self._use_redis:
             try:
                 redis_key = f"progress:{project_id}"
                 data = await self.redis.get(redis_key)
                 if data:
-                    progress_data = json.loads(data)
+                    progress_data = orjson.loads(data)
                     async with self._lock:
-                        self._memory_storage[key] = progress_data
+                        self._memory_set(key, progress_data)
                     return progress_data
             except Exception as e:
                 logger.warning(f"Failed to get progress from Redis: {e}")
@@ -224,7 +251,7 @@ class ProgressTracker:
         if not connections:
             return
         
-        message = json.dumps(progress_data)
+        message = orjson.dumps(progress_data).decode()
         dead_connections = []
         
         for websocket in connections:
@@ -260,7 +287,7 @@ class ProgressTracker:
         
         try:
             channel = f"project:{project_id}:progress"
-            await self.redis.publish(channel, json.dumps(progress_data))
+            await self.redis.publish(channel, orjson.dumps(progress_data))
         except Exception as e:
             logger.warning(f"Failed to publish progress to Redis: {e}, using memory storage only")
             self._use_redis = False
@@ -279,7 +306,7 @@ class ProgressTracker:
         key = str(project_id)
         
         async with self._lock:
-            self._memory_storage[key] = progress_data
+            self._memory_set(key, progress_data)
         
         if not self._use_redis:
             return
@@ -288,8 +315,8 @@ class ProgressTracker:
             redis_key = f"progress:{project_id}"
             await self.redis.setex(
                 redis_key,
-                3600,
-                json.dumps(progress_data)
+                self.PROGRESS_TTL_SECONDS,
+                orjson.dumps(progress_data)
             )
         except Exception as e:
             logger.warning(f"Failed to save progress to Redis: {e}, using memory storage only")
@@ -0,0 +1,85 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from src.agents.base import TaskStorageManager, StorageError
+from src.agents.base import task_storage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return TaskStorageManager("task_1", base_path=str(tmp_path))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_saves_are_coalesced_across_jobs(storage):
+    batch_sizes = []
+    write_batch = task_storage._write_batch
+    
+    def recording_write_batch(batch):
+        batch_sizes.append(len(batch))
+        return write_batch(batch)
+    
+    payloads = {f"{i}.png": bytes([i]) * 1024 for i in range(10)}
+    with patch.object(task_storage, "_write_batch", recording_write_batch):
+        paths = await asyncio.gather(*(
+            storage.save_image(data, filename) for filename, data in payloads.items()
+        ))
+    
+    # Saves issued together share dispatches, but a burst is still spread
+    # over several worker jobs rather than written serially by one
+    assert sum(batch_sizes) == 10
+    assert 1 < len(batch_sizes) < 10
+    assert max(batch_sizes) <= task_storage._WRITES_PER_JOB
+    for path, data in zip(paths, payloads.values()):
+        with open(path, "rb") as f:
+            assert f.read() == data
+
+
+@pytest.mark.asyncio
+async def test_failed_write_only_fails_its_own_save(storage):
+    good, bad = await asyncio.gather(
+        storage.save_image(b"ok", "good.png"),
+        storage.save_image(b"bad", "missing_dir/bad.png"),
+        return_exceptions=True,
+    )
+    
+    with open(good, "rb") as f:
+        assert f.read() == b"ok"
+    assert isinstance(bad, StorageError)
+
+
+@pytest.mark.asyncio
+async def test_saves_after_drain_start_a_new_batch(storage):
+    first = await storage.save_audio(b"a", "a.mp3")
+    second = await storage.save_audio(b"b", "b.mp3")
+    
+    with open(first, "rb") as f:
+        assert f.read() == b"a"
+    with open(second, "rb") as f:
+        assert f.read() == b"b"
+
+
+def test_next_filename_is_unique_and_stamped(tmp_path):
+    storage = TaskStorageManager("task_1", base_path=str(tmp_path), filename_stamp_length=6)
+    
+    names = {storage.next_filename("scene_1", "png") for _ in range(100)}
+    
+    assert len(names) == 100
+    stamp = next(iter(names)).split("_")[2]
+    assert len(stamp) == 6
+    assert all(name.startswith(f"scene_1_{stamp}_") and name.endswith(".png") for name in names)
+
+
+@pytest.mark.asyncio
+async def test_temp_dir_is_writable_after_cleanup(storage):
+    temp_dir = storage.ensure_temp_dir()
+    (temp_dir / "old.txt").write_bytes(b"old")
+    
+    await storage.cleanup_temp()
+    
+    assert list(temp_dir.iterdir()) == []
+    (temp_dir / "new.txt").write_bytes(b"new")
+    saved = await storage.save_temp(b"temp", "saved.txt")
+    with open(saved, "rb") as f:
+        assert f.read() == b"temp"
@@ -9,6 +9,22 @@ from src.agents.novel_parser import (
     ParseError,
     APIError,
 )
+from src.agents.novel_parser import agent as agent_module
+from src.agents.novel_parser.agent import _chunk_cache, _chunk_cache_get, _chunk_cache_put
+from tests.conftest import FakeLLM
+
+
+class FlakyLLM(FakeLLM):
+    """FakeLLM that fails every chunk containing fail_marker while failing is set"""
+    
+    fail_marker: str = "FAIL"
+    failing: bool = True
+    
+    async def _agenerate(self, messages, **kwargs):
+        if self.failing and self.fail_marker in messages[-1].content:
+            self.call_count += 1
+            raise APIError("chunk failed")
+        return await super()._agenerate(messages, **kwargs)
 
 
 @pytest.fixture
@@ -170,4 +186,89 @@ def test_validate_output_no_chapters(novel_parser_agent):
         plot_points=[]
     )
     with pytest.raises(ValidationError, match="No chapters extracted"):
-        novel_parser_agent._validate_output_model(result)
\ No newline at end of file
+        novel_parser_agent._validate_output_model(result)
+
+
+@pytest.fixture
+def clear_chunk_cache():
+    _chunk_cache.clear()
+    yield
+    _chunk_cache.clear()
+
+
+def test_chunk_cache_get_put(fake_llm, clear_chunk_cache):
+    key = (id(fake_llm), "chunk", 5, 10)
+    assert _chunk_cache_get(fake_llm, key) is None
+    
+    _chunk_cache_put(fake_llm, key, b'{"characters": []}')
+    assert _chunk_cache_get(fake_llm, key) == b'{"characters": []}'
+
+
+def test_chunk_cache_rejects_other_llm_with_same_key(fake_llm, clear_chunk_cache):
+    """A recycled id() must not return another llm's result"""
+    key = (id(fake_llm), "chunk", 5, 10)
+    _chunk_cache_put(fake_llm, key, b"{}")
+    
+    assert _chunk_cache_get(FakeLLM(), key) is None
+
+
+def test_chunk_cache_evicts_least_recently_used(fake_llm, clear_chunk_cache, monkeypatch):
+    monkeypatch.setattr(agent_module, "_CHUNK_CACHE_SIZE", 2)
+    _chunk_cache_put(fake_llm, ("a",), b"a")
+    _chunk_cache_put(fake_llm, ("b",), b"b")
+    assert _chunk_cache_get(fake_llm, ("a",)) == b"a"
+    
+    _chunk_cache_put(fake_llm, ("c",), b"c")
+    
+    assert _chunk_cache_get(fake_llm, ("b",)) is None
+    assert _chunk_cache_get(fake_llm, ("a",)) == b"a"
+    assert _chunk_cache_get(fake_llm, ("c",)) == b"c"
+
+
+@pytest.mark.asyncio
+async def test_parse_reuses_cached_chunks(fake_llm, clear_chunk_cache):
+    config = NovelParserConfig(model="gpt-4o-mini", chunk_size=200)
+    agent = NovelParserAgent(llm=fake_llm, config=config)
+    text = "\n\n".join(f"段落{i}" * 50 for i in range(3))
+    
+    first = await agent.parse(text)
+    assert fake_llm.call_count == 3
+    
+    second = await agent.parse(text)
+    
+    assert fake_llm.call_count == 3
+    # Merging renumbers scenes in place; a hit must decode a fresh copy
+    # rather than hand back the dicts the first merge already shifted
+    assert second == first
+
+
+@pytest.mark.asyncio
+async def test_parse_caches_chunks_that_succeeded_before_a_failure(fake_llm, clear_chunk_cache):
+    llm = FlakyLLM(responses=fake_llm.responses)
+    config = NovelParserConfig(model="gpt-4o-mini", chunk_size=200)
+    agent = NovelParserAgent(llm=llm, config=config)
+    text = ("x" * 150 + "\n\n") * 3 + "FAIL" * 30
+    
+    with pytest.raises(ParseError, match="chunk 4/4"):
+        await agent.parse(text)
+    assert llm.call_count == 4
+    
+    llm.failing = False
+    result = await agent.parse(text)
+    
+    # Only the chunk that failed is sent again
+    assert llm.call_count == 5
+    assert len(result.chapters) == 4
+
+
+@pytest.mark.asyncio
+async def test_parse_without_cache_calls_llm_every_time(fake_llm, clear_chunk_cache):
+    config = NovelParserConfig(model="gpt-4o-mini", chunk_size=200, enable_cache=False)
+    agent = NovelParserAgent(llm=fake_llm, config=config)
+    text = "\n\n".join(f"段落{i}" * 50 for i in range(3))
+    
+    await agent.parse(text)
+    await agent.parse(text)
+    
+    assert fake_llm.call_count == 6
+    assert not _chunk_cache
@@ -1,4 +1,6 @@
+import asyncio
 import pytest
+from email.utils import formatdate
 from unittest.mock import AsyncMock, MagicMock, patch
 from pathlib import Path
 
@@ -6,6 +8,12 @@ from src.agents.scene_renderer import (
     SceneRenderer,
     SceneRendererConfig,
 )
+from src.agents.scene_renderer.renderer import (
+    MAX_RETRY_AFTER_SECONDS,
+    _parse_retry_after,
+    _RateLimited,
+    _RequestPacer,
+)
 from src.agents.storyboard.models import (
     StoryboardResult,
     StoryboardChapter,
@@ -194,5 +202,180 @@ class TestSceneRenderer:
                 assert rendered_scene.audio_duration == 2.5
 
 
+
+class TestParseRetryAfter:
+    
+    NOW = 1_700_000_000.0
+    
+    @pytest.fixture(autouse=True)
+    def frozen_time(self):
+        with patch("src.agents.scene_renderer.renderer.time") as mock_time:
+            mock_time.time.return_value = self.NOW
+            yield
+    
+    def test_delta_seconds(self):
+        assert _parse_retry_after({"Retry-After": "120"}) == 120.0
+    
+    def test_negative_delta_clamped(self):
+        assert _parse_retry_after({"Retry-After": "-5"}) == 0.0
+    
+    def test_http_date(self):
+        headers = {"Retry-After": formatdate(self.NOW + 30, usegmt=True)}
+        assert _parse_retry_after(headers) == pytest.approx(30.0)
+    
+    def test_http_date_in_past_clamped(self):
+        headers = {"Retry-After": formatdate(self.NOW - 30, usegmt=True)}
+        assert _parse_retry_after(headers) == 0.0
+    
+    def test_rate_limit_reset_epoch(self):
+        headers = {"X-RateLimit-Reset": str(int(self.NOW) + 45)}
+        assert _parse_retry_after(headers) == pytest.approx(45.0)
+    
+    def test_rate_limit_reset_relative(self):
+        assert _parse_retry_after({"X-RateLimit-Reset": "10"}) == 10.0
+    
+    def test_garbage_retry_after_falls_back_to_reset(self):
+        headers = {"Retry-After": "soon", "X-RateLimit-Reset": "10"}
+        assert _parse_retry_after(headers) == 10.0
+    
+    @pytest.mark.parametrize("headers", [
+        {},
+        {"Retry-After": "soon"},
+        {"X-RateLimit-Reset": "tomorrow"},
+        {"Retry-After": "", "X-RateLimit-Reset": ""},
+    ])
+    def test_garbage_returns_none(self, headers):
+        assert _parse_retry_after(headers) is None
+
+
+
+class TestGenerationCoalescing:
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_share_one_request(self, renderer):
+        calls = []
+        key = renderer._generation_key("image", "model", "prompt")
+        
+        async def request():
+            calls.append(1)
+            await asyncio.sleep(0)
+            renderer._generation_cache_put(key, "/path/image.png")
+            return "/path/image.png"
+        
+        paths = await asyncio.gather(*(renderer._coalesce(key, request) for _ in range(3)))
+        
+        assert paths == ["/path/image.png"] * 3
+        assert len(calls) == 1
+        assert not renderer._pending_generations
+        
+        assert await renderer._coalesce(key, request) == "/path/image.png"
+        assert len(calls) == 1
+    
+    @pytest.mark.asyncio
+    async def test_failed_request_is_retried_next_time(self, renderer):
+        key = renderer._generation_key("tts", "voice", "text")
+        
+        async def failing():
+            raise RuntimeError("API down")
+        
+        async def succeeding():
+            return "/path/audio.mp3"
+        
+        results = await asyncio.gather(
+            renderer._coalesce(key, failing),
+            renderer._coalesce(key, failing),
+            return_exceptions=True,
+        )
+        
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert not renderer._pending_generations
+        assert await renderer._coalesce(key, succeeding) == "/path/audio.mp3"
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_shared_request(self, renderer):
+        key = renderer._generation_key("image", "shared")
+        release = asyncio.Event()
+        
+        async def request():
+            await release.wait()
+            return "/path/shared.png"
+        
+        cancelled = asyncio.ensure_future(renderer._coalesce(key, request))
+        waiting = asyncio.ensure_future(renderer._coalesce(key, request))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        release.set()
+        
+        assert await waiting == "/path/shared.png"
+        assert cancelled.cancelled()
+    
+    def test_generation_cache_evicts_least_recently_used(self, renderer):
+        renderer.GENERATION_CACHE_MAX_ENTRIES = 2
+        renderer._generation_cache_put(b"a", "/a")
+        renderer._generation_cache_put(b"b", "/b")
+        assert renderer._generation_cache_get(b"a") == "/a"
+        
+        renderer._generation_cache_put(b"c", "/c")
+        
+        assert renderer._generation_cache_get(b"b") is None
+        assert renderer._generation_cache_get(b"a") == "/a"
+        assert renderer._generation_cache_get(b"c") == "/c"
+    
+    def test_generation_key_keeps_parts_separate(self, renderer):
+        assert renderer._generation_key("a", "bc") != renderer._generation_key("ab", "c")
+        assert renderer._generation_key("a", "b") == renderer._generation_key("a", "b")
+
+
+class TestRequestPacer:
+    
+    @pytest.mark.asyncio
+    async def test_requests_are_spaced_by_interval(self):
+        pacer = _RequestPacer(requests_per_minute=6000)
+        loop = asyncio.get_running_loop()
+        
+        start = loop.time()
+        await pacer.acquire()
+        assert loop.time() - start < 0.01
+        
+        for _ in range(4):
+            await pacer.acquire()
+        
+        assert loop.time() - start >= 0.035
+    
+    @pytest.mark.asyncio
+    async def test_defer_postpones_next_slot(self):
+        pacer = _RequestPacer(requests_per_minute=6000)
+        loop = asyncio.get_running_loop()
+        
+        start = loop.time()
+        pacer.defer(0.05)
+        await pacer.acquire()
+        
+        assert loop.time() - start >= 0.045
+    
+    @pytest.mark.asyncio
+    async def test_rate_limited_retry_defers_pacer(self, config):
+        config.requests_per_minute = 60
+        renderer = SceneRenderer(task_id="test_task_123", config=config)
+        now = asyncio.get_running_loop().time()
+        
+        delay = renderer._retry_delay(_RateLimited("429", retry_after=5.0), attempt=0)
+        
+        assert 5.0 <= delay <= 6.0
+        assert renderer._pacer._next_slot >= now + 5.0
+    
+    @pytest.mark.asyncio
+    async def test_oversized_retry_after_is_clamped(self, config):
+        config.requests_per_minute = 60
+        renderer = SceneRenderer(task_id="test_task_123", config=config)
+        retry_after = _parse_retry_after({"Retry-After": "86400"})
+        now = asyncio.get_running_loop().time()
+        
+        delay = renderer._retry_delay(_RateLimited("429", retry_after=retry_after), attempt=0)
+        
+        assert MAX_RETRY_AFTER_SECONDS <= delay <= MAX_RETRY_AFTER_SECONDS + 1.0
+        assert renderer._pacer._next_slot <= now + MAX_RETRY_AFTER_SECONDS + 1.0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
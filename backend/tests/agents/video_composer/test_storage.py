@@ -54,7 +54,7 @@ async def test_local_storage_save_file(temp_dir):
 async def test_local_storage_save_error(temp_dir):
     storage = LocalStorage(base_path=temp_dir)
     
-    with patch("pathlib.Path.write_bytes", side_effect=Exception("Write error")):
+    with patch("src.agents.base.storage.write_bytes", side_effect=Exception("Write error")):
         with pytest.raises(StorageError, match="Failed to save file"):
             await storage.save(b"data", "test.mp4")
 
@@ -110,6 +110,31 @@ async def test_oss_storage_save_file(temp_dir):
         assert mock_bucket.put_object.called
 
 
+@pytest.mark.asyncio
+async def test_oss_storage_save_large_file_uses_resumable_upload(temp_dir):
+    with pytest.MonkeyPatch().context() as mp:
+        mock_oss2 = MagicMock()
+        mp.setitem(sys.modules, 'oss2', mock_oss2)
+        
+        checkpoint_dir = str(Path(temp_dir) / "checkpoints")
+        storage = OSSStorage(
+            bucket="test-bucket",
+            endpoint="oss-cn-hangzhou.aliyuncs.com",
+            access_key="test-key",
+            secret_key="test-secret",
+            checkpoint_dir=checkpoint_dir,
+        )
+        storage.MULTIPART_THRESHOLD = 4
+        
+        source_file = Path(temp_dir) / "source.mp4"
+        source_file.write_bytes(b"fake video data")
+        
+        result = await storage.save_file(str(source_file), "test.mp4")
+        
+        assert "test.mp4" in result
+        mock_oss2.ResumableStore.assert_called_once_with(root=checkpoint_dir)
+        _, kwargs = mock_oss2.resumable_upload.call_args
+        assert kwargs["store"] is mock_oss2.ResumableStore.return_value
 @pytest.mark.asyncio
 async def test_oss_storage_missing_oss2():
     storage = OSSStorage(
@@ -0,0 +1,58 @@
+import pytest
+from unittest.mock import patch
+from uuid import uuid4
+
+from src.core.progress_tracker import ProgressTracker
+
+
+@pytest.fixture
+def tracker():
+    return ProgressTracker()
+
+
+@pytest.fixture
+def clock():
+    with patch("src.core.progress_tracker.time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        yield mock_time
+
+
+@pytest.mark.asyncio
+async def test_progress_round_trip(tracker):
+    project_id = uuid4()
+    await tracker.update(project_id, "novel_parsing", 10, "解析中")
+    
+    progress = await tracker.get_progress(project_id)
+    
+    assert progress["stage"] == "novel_parsing"
+    assert progress["progress"] == 10
+
+
+@pytest.mark.asyncio
+async def test_progress_expires_after_ttl(tracker, clock):
+    project_id = uuid4()
+    await tracker.update(project_id, "novel_parsing", 10, "解析中")
+    
+    clock.monotonic.return_value += tracker.PROGRESS_TTL_SECONDS - 1
+    assert await tracker.get_progress(project_id) is not None
+    
+    clock.monotonic.return_value += 2
+    assert await tracker.get_progress(project_id) is None
+    assert not tracker._memory_storage
+
+
+@pytest.mark.asyncio
+async def test_progress_evicts_least_recently_used(tracker):
+    tracker.MEMORY_MAX_ENTRIES = 2
+    first, second, third = uuid4(), uuid4(), uuid4()
+    await tracker.update(first, "a", 1, "")
+    await tracker.update(second, "b", 2, "")
+    # Reading the first entry makes the second the least recently used
+    assert await tracker.get_progress(first) is not None
+    
+    await tracker.update(third, "c", 3, "")
+    
+    assert len(tracker._memory_storage) == 2
+    assert await tracker.get_progress(second) is None
+    assert await tracker.get_progress(first) is not None
+    assert await tracker.get_progress(third) is not None